@@ -1,16 +1,168 @@
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 
+def parent_path(path: str) -> str:
+    """
+    Return the parent directory of an FTP path ("/" for root-level entries).
+
+    Args:
+        path: The path whose parent should be computed.
+    """
+    # Normalize path separators and remove trailing slash if present
+    normalized = path.replace("\\", "/").rstrip("/")
+    # rpartition yields "" for root-level entries and bare names alike
+    return normalized.rpartition("/")[0] or "/"
+
+
+# Upper bound on entries per cache instance
+DEFAULT_MAX_ENTRIES = 10000
+
+
 @dataclass
 class CacheEntry:
     data: Any
     expires_at: float
 
 
-class DirectoryCache:
+class _PathIndexedCache:
+    """
+    TTL cache storage keyed by FTP path, with a parent -> children index.
+
+    The index lets a whole subtree be dropped (e.g. after a directory rename)
+    by walking just that subtree instead of scanning every key. Interior
+    directories appear in the index even when they are not cached themselves,
+    so a subtree stays reachable from any ancestor.
+
+    At most max_entries entries are kept; inserting beyond that evicts the
+    least recently used entry, so paths visited once cannot grow the cache
+    without bound in a long-running mount while hot paths such as "/" stay.
+
+    Lookups do not take the lock: a single dict read is atomic, and writers
+    only ever replace whole entries. A hit moves the entry to the recent end
+    with one OrderedDict call, which is also atomic. The lock is taken by
+    writers and when a lookup evicts an expired entry. A reader racing a
+    writer sees either the old entry or the new one, which is acceptable for
+    a TTL cache. FTPFileSystem already runs every callback under its own
+    lock, so this only pays off for FTPClient's caches, which are read
+    before the connection lock is taken.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # Ordered least to most recently used
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._children: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _store(self, path: str, data: Any, ttl_seconds: float) -> None:
+        """Insert or replace an entry and link it into the index."""
+        with self._lock:
+            if path in self._cache:
+                self._cache.move_to_end(path)
+            else:
+                if len(self._cache) >= self.max_entries:
+                    oldest, _ = self._cache.popitem(last=False)
+                    self._unlink(oldest)
+                self._link(path)
+            self._cache[path] = CacheEntry(data=data, expires_at=time.time() + ttl_seconds)
+
+    def _lookup(self, path: str) -> Any:
+        """Return the live entry's data and mark it recently used, else None."""
+        entry = self._cache.get(path)
+        if entry is None:
+            return None
+        if time.time() >= entry.expires_at:
+            self._evict(path, entry)
+            return None
+        try:
+            self._cache.move_to_end(path)
+        except KeyError:
+            # Invalidated by another thread since the read above
+            pass
+        return entry.data
+
+    def _link(self, path: str) -> None:
+        """Add path and any missing ancestors to the index. Caller must hold lock."""
+        while path != "/":
+            parent = parent_path(path)
+            siblings = self._children.setdefault(parent, set())
+            if path in siblings:
+                return
+            siblings.add(path)
+            path = parent
+
+    def _unlink(self, path: str) -> None:
+        """Prune path and newly empty ancestors from the index. Caller must hold lock."""
+        while path != "/" and path not in self._cache and not self._children.get(path):
+            parent = parent_path(path)
+            siblings = self._children.get(parent)
+            if siblings is None:
+                return
+            siblings.discard(path)
+            if siblings:
+                return
+            del self._children[parent]
+            path = parent
+
+    def _evict(self, path: str, entry: CacheEntry) -> None:
+        """Remove an expired entry unless a writer has already replaced it."""
+        with self._lock:
+            if self._cache.get(path) is entry:
+                del self._cache[path]
+                self._unlink(path)
+
+    def invalidate(self, path: str) -> None:
+        """
+        Invalidate cache for a specific path.
+
+        Args:
+            path: The path to invalidate.
+        """
+        with self._lock:
+            if self._cache.pop(path, None) is not None:
+                self._unlink(path)
+
+    def invalidate_many(self, paths: Iterable[str]) -> None:
+        """
+        Invalidate several paths under a single lock acquisition.
+
+        Args:
+            paths: The paths to invalidate.
+        """
+        with self._lock:
+            for path in paths:
+                if self._cache.pop(path, None) is not None:
+                    self._unlink(path)
+
+    def invalidate_tree(self, path: str) -> None:
+        """
+        Invalidate a path and everything cached beneath it.
+
+        Args:
+            path: The root of the subtree to invalidate.
+        """
+        with self._lock:
+            stack = [path]
+            while stack:
+                current = stack.pop()
+                self._cache.pop(current, None)
+                stack.extend(self._children.pop(current, ()))
+            self._unlink(path)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._cache.clear()
+            self._children.clear()
+
+
+class DirectoryCache(_PathIndexedCache):
     """
     Cache for directory listings (ls commands).
 
@@ -18,11 +170,6 @@ class DirectoryCache:
     Used to reduce FTP round-trips for directory enumeration.
     """
 
-    def __init__(self, ttl_seconds: int):
-        self.ttl_seconds = ttl_seconds
-        self._cache: dict[str, CacheEntry] = {}
-        self._lock = threading.Lock()
-
     def get(self, path: str) -> list[Any] | None:
         """
         Retrieve directory listing if cached and not expired.
@@ -33,15 +180,7 @@ class DirectoryCache:
         Returns:
             The cached listing if present and not expired, else None.
         """
-        with self._lock:
-            entry = self._cache.get(path)
-            if entry is None:
-                return None
-            if time.time() >= entry.expires_at:
-                # Entry expired, remove it
-                del self._cache[path]
-                return None
-            return entry.data
+        return self._lookup(path)
 
     def put(self, path: str, listing: list[Any]) -> None:
         """
@@ -51,19 +190,7 @@ class DirectoryCache:
             path: The directory path.
             listing: The directory listing to cache.
         """
-        with self._lock:
-            expires_at = time.time() + self.ttl_seconds
-            self._cache[path] = CacheEntry(data=listing, expires_at=expires_at)
-
-    def invalidate(self, path: str) -> None:
-        """
-        Invalidate cache for a specific path.
-
-        Args:
-            path: The directory path to invalidate.
-        """
-        with self._lock:
-            self._cache.pop(path, None)
+        self._store(path, listing, self.ttl_seconds)
 
     def invalidate_parent(self, path: str) -> None:
         """
@@ -72,24 +199,10 @@ class DirectoryCache:
         Args:
             path: The path whose parent should be invalidated.
         """
-        # Normalize path separators and extract parent
-        normalized = path.replace("\\", "/")
-        # Remove trailing slash if present
-        normalized = normalized.rstrip("/")
-
-        if "/" in normalized:
-            parent = normalized.rsplit("/", 1)[0]
-            # Handle root case
-            if not parent:
-                parent = "/"
-        else:
-            # Path is at root level, parent is root
-            parent = "/"
-
-        self.invalidate(parent)
+        self.invalidate(parent_path(path))
 
 
-class MetadataCache:
+class MetadataCache(_PathIndexedCache):
     """
     Cache for file metadata (size, mtime, etc.).
 
@@ -97,11 +210,6 @@ class MetadataCache:
     Used to reduce FTP round-trips for stat operations.
     """
 
-    def __init__(self, ttl_seconds: int):
-        self.ttl_seconds = ttl_seconds
-        self._cache: dict[str, CacheEntry] = {}
-        self._lock = threading.Lock()
-
     def get(self, path: str) -> dict[str, Any] | None:
         """
         Retrieve file metadata if cached and not expired.
@@ -112,34 +220,16 @@ class MetadataCache:
         Returns:
             The cached metadata dict if present and not expired, else None.
         """
-        with self._lock:
-            entry = self._cache.get(path)
-            if entry is None:
-                return None
-            if time.time() >= entry.expires_at:
-                # Entry expired, remove it
-                del self._cache[path]
-                return None
-            return entry.data
+        return self._lookup(path)
 
-    def put(self, path: str, metadata: dict[str, Any]) -> None:
+    def put(self, path: str, metadata: Any, ttl_seconds: float | None = None) -> None:
         """
         Cache file metadata.
 
         Args:
             path: The file path.
             metadata: The metadata dict to cache.
+            ttl_seconds: Optional TTL override for this entry (e.g. a shorter
+                TTL for negative "not found" results).
         """
-        with self._lock:
-            expires_at = time.time() + self.ttl_seconds
-            self._cache[path] = CacheEntry(data=metadata, expires_at=expires_at)
-
-    def invalidate(self, path: str) -> None:
-        """
-        Invalidate cache for a specific path.
-
-        Args:
-            path: The file path to invalidate.
-        """
-        with self._lock:
-            self._cache.pop(path, None)
+        self._store(path, metadata, self.ttl_seconds if ttl_seconds is None else ttl_seconds)
@@ -12,6 +12,8 @@ class FTPConfig:
     passive_mode: bool = True
     encoding: str = "utf-8"
     secure: bool = False  # FTPS (FTP over TLS)
+    # RETR/STOR block size; ftplib's 8 KiB default means many tiny socket calls
+    transfer_block_size: int = 256 * 1024
 
 
 @dataclass
@@ -25,6 +27,8 @@ class CacheConfig:
     enabled: bool = True
     directory_ttl_seconds: int = 30
     metadata_ttl_seconds: int = 60
+    negative_ttl_seconds: int = 5
+    max_entries: int = 10000  # Per cache; oldest entries are evicted beyond this
 
 
 @dataclass
@@ -33,6 +37,10 @@ class ConnectionConfig:
     retry_attempts: int = 3
     retry_delay_seconds: int = 1
     keepalive_interval_seconds: int = 60
+    pool_size: int = 0  # Idle logged-in connections kept per server (0 disables pooling)
+    # FTPClient stat/listing cache; off by default because FTPFileSystem
+    # keeps its own caches on top of the client (0 disables)
+    stat_cache_ttl_seconds: float = 0
 
 
 @dataclass
@@ -76,6 +84,7 @@ def load_config(config_path: str | None = None, **cli_args) -> AppConfig:
         "passive_mode": True,
         "encoding": "utf-8",
         "secure": False,
+        "transfer_block_size": 256 * 1024,
     }
     mount_config = {
         "drive_letter": None,
@@ -85,12 +94,16 @@ def load_config(config_path: str | None = None, **cli_args) -> AppConfig:
         "enabled": True,
         "directory_ttl_seconds": 30,
         "metadata_ttl_seconds": 60,
+        "negative_ttl_seconds": 5,
+        "max_entries": 10000,
     }
     connection_config = {
         "timeout_seconds": 30,
         "retry_attempts": 3,
         "retry_delay_seconds": 1,
         "keepalive_interval_seconds": 60,
+        "pool_size": 0,
+        "stat_cache_ttl_seconds": 0,
     }
     log_config = {
         "level": "INFO",
@@ -137,6 +150,13 @@ def load_config(config_path: str | None = None, **cli_args) -> AppConfig:
                     "1",
                     "yes",
                 )
+            if ftp_section.get("transfer_block_size"):
+                try:
+                    ftp_config["transfer_block_size"] = int(ftp_section.get("transfer_block_size"))
+                except ValueError:
+                    raise ValueError(
+                        f"Invalid transfer_block_size value in config: '{ftp_section.get('transfer_block_size')}' - must be an integer"
+                    )
 
         # Load [mount] section
         if parser.has_section("mount"):
@@ -173,6 +193,22 @@ def load_config(config_path: str | None = None, **cli_args) -> AppConfig:
                     raise ValueError(
                         f"Invalid metadata_ttl_seconds value in config: '{cache_section.get('metadata_ttl_seconds')}' - must be an integer"
                     )
+            if cache_section.get("negative_ttl_seconds"):
+                try:
+                    cache_config["negative_ttl_seconds"] = int(
+                        cache_section.get("negative_ttl_seconds")
+                    )
+                except ValueError:
+                    raise ValueError(
+                        f"Invalid negative_ttl_seconds value in config: '{cache_section.get('negative_ttl_seconds')}' - must be an integer"
+                    )
+            if cache_section.get("max_entries"):
+                try:
+                    cache_config["max_entries"] = int(cache_section.get("max_entries"))
+                except ValueError:
+                    raise ValueError(
+                        f"Invalid max_entries value in config: '{cache_section.get('max_entries')}' - must be an integer"
+                    )
 
         # Load [connection] section
         if parser.has_section("connection"):
@@ -209,6 +245,22 @@ def load_config(config_path: str | None = None, **cli_args) -> AppConfig:
                     raise ValueError(
                         f"Invalid keepalive_interval_seconds value in config: '{conn_section.get('keepalive_interval_seconds')}' - must be an integer"
                     )
+            if conn_section.get("pool_size"):
+                try:
+                    connection_config["pool_size"] = int(conn_section.get("pool_size"))
+                except ValueError:
+                    raise ValueError(
+                        f"Invalid pool_size value in config: '{conn_section.get('pool_size')}' - must be an integer"
+                    )
+            if conn_section.get("stat_cache_ttl_seconds"):
+                try:
+                    connection_config["stat_cache_ttl_seconds"] = float(
+                        conn_section.get("stat_cache_ttl_seconds")
+                    )
+                except ValueError:
+                    raise ValueError(
+                        f"Invalid stat_cache_ttl_seconds value in config: '{conn_section.get('stat_cache_ttl_seconds')}' - must be a number"
+                    )
 
         # Load [logging] section
         if parser.has_section("logging"):
@@ -269,6 +321,7 @@ def load_config(config_path: str | None = None, **cli_args) -> AppConfig:
             passive_mode=ftp_config["passive_mode"],
             encoding=ftp_config["encoding"],
             secure=ftp_config["secure"],
+            transfer_block_size=ftp_config["transfer_block_size"],
         ),
         mount=MountConfig(
             drive_letter=mount_config["drive_letter"],
@@ -278,12 +331,16 @@ def load_config(config_path: str | None = None, **cli_args) -> AppConfig:
             enabled=cache_config["enabled"],
             directory_ttl_seconds=cache_config["directory_ttl_seconds"],
             metadata_ttl_seconds=cache_config["metadata_ttl_seconds"],
+            negative_ttl_seconds=cache_config["negative_ttl_seconds"],
+            max_entries=cache_config["max_entries"],
         ),
         connection=ConnectionConfig(
             timeout_seconds=connection_config["timeout_seconds"],
             retry_attempts=connection_config["retry_attempts"],
             retry_delay_seconds=connection_config["retry_delay_seconds"],
             keepalive_interval_seconds=connection_config["keepalive_interval_seconds"],
+            pool_size=connection_config["pool_size"],
+            stat_cache_ttl_seconds=connection_config["stat_cache_ttl_seconds"],
         ),
         logging=LogConfig(
             level=log_config["level"],
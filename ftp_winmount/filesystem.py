@@ -5,7 +5,8 @@ This module implements WinFsp filesystem callbacks that translate
 Windows file operations into FTP protocol commands.
 """
 
-from functools import wraps
+from functools import lru_cache, wraps
+from operator import itemgetter
 
 try:
     from winfspy import (
@@ -78,11 +79,11 @@ except ImportError:
 
 import logging
 import threading
+from bisect import bisect_right
 from datetime import datetime
-from io import BytesIO
 from typing import Any
 
-from .cache import DirectoryCache, MetadataCache
+from .cache import DirectoryCache, MetadataCache, parent_path
 from .ftp_client import FileStats, FTPClient
 
 logger = logging.getLogger(__name__)
@@ -101,6 +102,18 @@ FspCleanupSetChangeTime = 0x80
 # Aliases for test compatibility
 FSP_CLEANUP_DELETE = FspCleanupDelete
 
+# Metadata cache sentinel for paths known not to exist. Explorer probes for
+# desktop.ini, thumbs.db, etc. on every directory visit; caching the miss
+# briefly avoids repeating the FTP round-trip for each probe.
+_MISS = object()
+
+_entry_name = itemgetter("file_name")
+
+# Minimum span fetched per read. Explorer and most applications read
+# sequentially in 4-64 KiB requests; fetching a larger window and serving
+# follow-up reads from memory saves a RETR (and data connection) per request.
+READ_AHEAD_SIZE = 512 * 1024
+
 
 def datetime_to_filetime(dt: datetime) -> int:
     """Convert Python datetime to Windows FILETIME integer."""
@@ -111,6 +124,24 @@ def datetime_to_filetime(dt: datetime) -> int:
     return int(timestamp * 10000000) + EPOCH_DIFF
 
 
+@lru_cache(maxsize=4096)
+def _to_ftp_path(win_path: str) -> str:
+    """Convert Windows path to FTP path.
+
+    Conversion is pure, so results are memoized by input string; the same
+    handful of paths are converted on nearly every WinFsp callback.
+    """
+    if not win_path:
+        return "/"
+    # Fast path: already an FTP-style path, nothing to convert
+    if win_path[0] == "/" and "\\" not in win_path:
+        return win_path
+    path = win_path.lstrip("\\").replace("\\", "/")
+    if not path:
+        return "/"
+    return "/" + path if not path.startswith("/") else path
+
+
 def operation(fn):
     """Decorator for filesystem operations - provides thread safety and logging."""
     name = fn.__name__
@@ -135,6 +166,21 @@ class OpenedContext:
     All times are FILETIME integers (100-nanosecond intervals since 1601).
     """
 
+    __slots__ = (
+        "path",
+        "is_directory",
+        "file_size",
+        "attributes",
+        "creation_time",
+        "last_access_time",
+        "last_write_time",
+        "change_time",
+        "buffer",
+        "dirty",
+        "read_cache",
+        "info",
+    )
+
     def __init__(
         self, path: str, is_directory: bool, file_size: int, attributes: int, mtime_filetime: int
     ):
@@ -146,9 +192,24 @@ class OpenedContext:
         self.last_access_time = mtime_filetime
         self.last_write_time = mtime_filetime
         self.change_time = mtime_filetime
-        # For write buffering
+        # For write buffering (bytearray holding the full file content)
         self.buffer = None
         self.dirty = False
+        # Read-ahead window: (offset, data) from the last FTP read
+        self.read_cache: tuple[int, bytes] | None = None
+        # Reused by get_file_info(); the times never change after open, so
+        # only size and attributes are refreshed per call. WinFsp copies it
+        # out immediately, so it is never handed out for longer than that
+        self.info: dict[str, Any] = {
+            "file_attributes": attributes,
+            "file_size": file_size,
+            "allocation_size": file_size,
+            "creation_time": mtime_filetime,
+            "last_access_time": mtime_filetime,
+            "last_write_time": mtime_filetime,
+            "change_time": mtime_filetime,
+            "index_number": 0,
+        }
 
     def __repr__(self):
         return f"OpenedContext({self.path!r})"
@@ -165,20 +226,36 @@ class FTPFileSystem(BaseFileSystemOperations):
         super().__init__()
         self._thread_lock = threading.Lock()
         self.ftp = ftp_client
-        self.dir_cache = DirectoryCache(cache_config.directory_ttl_seconds)
-        self.meta_cache = MetadataCache(cache_config.metadata_ttl_seconds)
+        # Bound once; every callback goes through one of these
+        self._read_file = ftp_client.read_file
+        self._write_file = ftp_client.write_file
+        self._get_file_info = ftp_client.get_file_info
+        self._list_dir = ftp_client.list_dir
+        self._create_file = ftp_client.create_file
+        self._create_dir = ftp_client.create_dir
+        self._delete_file = ftp_client.delete_file
+        self._delete_dir = ftp_client.delete_dir
+        self._rename = ftp_client.rename
+        self.dir_cache = DirectoryCache(
+            cache_config.directory_ttl_seconds, cache_config.max_entries
+        )
+        self.meta_cache = MetadataCache(cache_config.metadata_ttl_seconds, cache_config.max_entries)
+        self.negative_ttl_seconds = cache_config.negative_ttl_seconds
         logger.info(
-            "FTPFileSystem initialized with cache TTLs: dir=%d, meta=%d",
+            "FTPFileSystem initialized with cache TTLs: dir=%d, meta=%d, negative=%d",
             cache_config.directory_ttl_seconds,
             cache_config.metadata_ttl_seconds,
+            cache_config.negative_ttl_seconds,
         )
 
+    def _invalidate(self, *ftp_paths: str) -> None:
+        """Drop cached metadata for paths and listings for them and their parents."""
+        self.meta_cache.invalidate_many(ftp_paths)
+        self.dir_cache.invalidate_many(ftp_paths + tuple(parent_path(p) for p in ftp_paths))
+
     def _to_ftp_path(self, win_path: str) -> str:
         """Convert Windows path to FTP path."""
-        path = win_path.lstrip("\\").replace("\\", "/")
-        if not path:
-            return "/"
-        return "/" + path if not path.startswith("/") else path
+        return _to_ftp_path(win_path)
 
     def _filestats_to_attributes(self, stats: FileStats) -> int:
         """Convert FileStats to Windows file attributes."""
@@ -200,6 +277,8 @@ class FTPFileSystem(BaseFileSystemOperations):
         logger.debug("get_security_by_name: %s -> %s", file_name, ftp_path)
 
         cached = self.meta_cache.get(ftp_path)
+        if cached is _MISS:
+            raise NTStatusObjectNameNotFound()
         if cached is not None:
             if _DEFAULT_SD is None:
                 # Fallback when winfspy not available: return placeholder values
@@ -208,9 +287,9 @@ class FTPFileSystem(BaseFileSystemOperations):
             return (cached["attributes"], _DEFAULT_SD.handle, _DEFAULT_SD.size)
 
         try:
-            stats = self.ftp.get_file_info(ftp_path)
+            stats = self._get_file_info(ftp_path)
             attributes = self._filestats_to_attributes(stats)
-            mtime_filetime = datetime_to_filetime(stats.mtime)
+            mtime_filetime = stats.filetime()
             self.meta_cache.put(
                 ftp_path,
                 {
@@ -227,6 +306,7 @@ class FTPFileSystem(BaseFileSystemOperations):
             return (attributes, _DEFAULT_SD.handle, _DEFAULT_SD.size)
 
         except FileNotFoundError:
+            self.meta_cache.put(ftp_path, _MISS, ttl_seconds=self.negative_ttl_seconds)
             raise NTStatusObjectNameNotFound()
         except PermissionError:
             raise NTStatusAccessDenied()
@@ -240,6 +320,8 @@ class FTPFileSystem(BaseFileSystemOperations):
         logger.debug("open: %s -> %s", file_name, ftp_path)
 
         cached = self.meta_cache.get(ftp_path)
+        if cached is _MISS:
+            raise NTStatusObjectNameNotFound()
         if cached is not None:
             mtime_filetime = cached.get("mtime_filetime")
             if mtime_filetime is None:
@@ -253,9 +335,9 @@ class FTPFileSystem(BaseFileSystemOperations):
             )
 
         try:
-            stats = self.ftp.get_file_info(ftp_path)
+            stats = self._get_file_info(ftp_path)
             attributes = self._filestats_to_attributes(stats)
-            mtime_filetime = datetime_to_filetime(stats.mtime)
+            mtime_filetime = stats.filetime()
             self.meta_cache.put(
                 ftp_path,
                 {
@@ -274,6 +356,7 @@ class FTPFileSystem(BaseFileSystemOperations):
             )
 
         except FileNotFoundError:
+            self.meta_cache.put(ftp_path, _MISS, ttl_seconds=self.negative_ttl_seconds)
             raise NTStatusObjectNameNotFound()
         except PermissionError:
             raise NTStatusAccessDenied()
@@ -288,14 +371,28 @@ class FTPFileSystem(BaseFileSystemOperations):
     @operation
     def read(self, file_context: OpenedContext, offset: int, length: int) -> bytes:
         """Read data from file."""
-        if offset >= file_context.file_size:
+        # Clamp to EOF once; covers both offset-past-end and a short final read
+        remaining = file_context.file_size - offset
+        length = min(length, remaining) if remaining > 0 else 0
+        if length <= 0:
             return b""
 
-        remaining = file_context.file_size - offset
-        actual_length = min(length, remaining)
+        # A write buffer holds the full, possibly unflushed, content
+        if file_context.buffer is not None:
+            return bytes(file_context.buffer[offset : offset + length])
+
+        if file_context.read_cache is not None:
+            start, data = file_context.read_cache
+            rel = offset - start
+            if rel >= 0 and rel + length <= len(data):
+                return data[rel : rel + length]
 
         try:
-            return self.ftp.read_file(file_context.path, offset, actual_length)
+            data = self._read_file(
+                file_context.path, offset, min(max(length, READ_AHEAD_SIZE), remaining)
+            )
+            file_context.read_cache = (offset, data)
+            return data[:length]
         except FileNotFoundError:
             raise NTStatusObjectNameNotFound()
         except PermissionError:
@@ -313,14 +410,17 @@ class FTPFileSystem(BaseFileSystemOperations):
 
         if cached_entries is None:
             try:
-                stats_list = self.ftp.list_dir(path)
+                stats_list = self._list_dir(path)
                 cached_entries = []
+                prefix = path.rstrip("/") + "/"
                 for stats in stats_list:
                     attributes = self._filestats_to_attributes(stats)
-                    mtime_filetime = datetime_to_filetime(stats.mtime)
+                    mtime_filetime = stats.filetime()
+                    # Stored in the shape WinFsp expects, so serving from
+                    # the cache is a plain copy
                     cached_entries.append(
                         {
-                            "name": stats.name,
+                            "file_name": stats.name,
                             "file_size": stats.size,
                             "allocation_size": stats.size,
                             "creation_time": mtime_filetime,
@@ -328,12 +428,12 @@ class FTPFileSystem(BaseFileSystemOperations):
                             "last_write_time": mtime_filetime,
                             "change_time": mtime_filetime,
                             "file_attributes": attributes,
-                            "is_dir": stats.is_dir,
                         }
                     )
-                    file_path = path.rstrip("/") + "/" + stats.name
+                    # Warm the metadata cache so per-child lookups that follow
+                    # a listing are served without another FTP round-trip
                     self.meta_cache.put(
-                        file_path,
+                        prefix + stats.name,
                         {
                             "file_size": stats.size,
                             "attributes": attributes,
@@ -341,6 +441,8 @@ class FTPFileSystem(BaseFileSystemOperations):
                             "is_dir": stats.is_dir,
                         },
                     )
+                # Sorted by name so marker pagination can bisect
+                cached_entries.sort(key=_entry_name)
                 self.dir_cache.put(path, cached_entries)
 
             except FileNotFoundError:
@@ -350,27 +452,9 @@ class FTPFileSystem(BaseFileSystemOperations):
             except TimeoutError:
                 raise NTStatusIOTimeout()
 
-        result = []
-        past_marker = marker is None
-        for entry in cached_entries:
-            name = entry["name"]
-            if not past_marker:
-                if name == marker:
-                    past_marker = True
-                continue
-            result.append(
-                {
-                    "file_name": name,
-                    "file_size": entry["file_size"],
-                    "allocation_size": entry["allocation_size"],
-                    "creation_time": entry["creation_time"],
-                    "last_access_time": entry["last_access_time"],
-                    "last_write_time": entry["last_write_time"],
-                    "change_time": entry["change_time"],
-                    "file_attributes": entry["file_attributes"],
-                }
-            )
-        return result
+        start = 0 if marker is None else bisect_right(cached_entries, marker, key=_entry_name)
+        # Copies keep the cached entries safe from changes made by the caller
+        return [entry.copy() for entry in cached_entries[start:]]
 
     @operation
     def get_security(self, file_context: OpenedContext):
@@ -387,17 +471,16 @@ class FTPFileSystem(BaseFileSystemOperations):
 
     @operation
     def get_file_info(self, file_context: OpenedContext) -> dict[str, Any]:
-        """Get file metadata."""
-        return {
-            "file_attributes": file_context.attributes,
-            "file_size": file_context.file_size,
-            "allocation_size": file_context.file_size,
-            "creation_time": file_context.creation_time,
-            "last_access_time": file_context.last_access_time,
-            "last_write_time": file_context.last_write_time,
-            "change_time": file_context.change_time,
-            "index_number": 0,
-        }
+        """Get file metadata.
+
+        The returned dict belongs to the handle and is rewritten in place by
+        the next get_file_info() call; it is only valid until the next
+        operation on the handle. Copy it to keep a snapshot.
+        """
+        info = file_context.info
+        info["file_attributes"] = file_context.attributes
+        info["file_size"] = info["allocation_size"] = file_context.file_size
+        return info
 
     @operation
     def write(
@@ -409,21 +492,28 @@ class FTPFileSystem(BaseFileSystemOperations):
         constrained_io: bool = False,
     ) -> int:
         """Write data to file."""
+        if write_to_end_of_file:
+            offset = file_context.file_size
+
         if file_context.buffer is None:
-            if file_context.file_size > 0:
+            # A write covering the whole file (a typical save) needs no download
+            if file_context.file_size > 0 and not (
+                offset == 0 and len(buffer) >= file_context.file_size
+            ):
                 try:
-                    existing_data = self.ftp.read_file(file_context.path, 0, None)
-                    file_context.buffer = BytesIO(existing_data)
+                    existing_data = self._read_file(file_context.path, 0, None)
+                    file_context.buffer = bytearray(existing_data)
                 except FileNotFoundError:
-                    file_context.buffer = BytesIO()
+                    file_context.buffer = bytearray()
             else:
-                file_context.buffer = BytesIO()
-
-        if write_to_end_of_file:
-            offset = file_context.file_size
+                file_context.buffer = bytearray()
 
-        file_context.buffer.seek(offset)
-        bytes_written = file_context.buffer.write(buffer)
+        buf = file_context.buffer
+        bytes_written = len(buffer)
+        if offset > len(buf):
+            # Writing past the end leaves a zero-filled gap
+            buf.extend(bytes(offset - len(buf)))
+        buf[offset : offset + bytes_written] = buffer
 
         new_size = offset + bytes_written
         if new_size > file_context.file_size:
@@ -439,10 +529,9 @@ class FTPFileSystem(BaseFileSystemOperations):
             return
 
         try:
-            file_context.buffer.seek(0)
-            data = file_context.buffer.read()
-            self.ftp.write_file(file_context.path, data, 0)
-            self.meta_cache.invalidate(file_context.path)
+            data = bytes(file_context.buffer)
+            self._write_file(file_context.path, data, 0)
+            self._invalidate(file_context.path)
             file_context.dirty = False
         except PermissionError:
             raise NTStatusAccessDenied()
@@ -455,7 +544,7 @@ class FTPFileSystem(BaseFileSystemOperations):
     def set_file_info(self, file_context: OpenedContext, file_info: dict[str, Any]) -> None:
         """Set file metadata."""
         if "file_size" in file_info and file_info["file_size"] == 0:
-            file_context.buffer = BytesIO()
+            file_context.buffer = bytearray()
             file_context.file_size = 0
             file_context.dirty = True
 
@@ -478,25 +567,20 @@ class FTPFileSystem(BaseFileSystemOperations):
         if file_context.buffer is None:
             if file_context.file_size > 0:
                 try:
-                    content = self.ftp.read_file(file_context.path)
-                    file_context.buffer = BytesIO(content)
+                    content = self._read_file(file_context.path)
+                    file_context.buffer = bytearray(content)
                 except FileNotFoundError:
-                    file_context.buffer = BytesIO()
+                    file_context.buffer = bytearray()
             else:
-                file_context.buffer = BytesIO()
+                file_context.buffer = bytearray()
 
-        # Truncate or extend the buffer
-        file_context.buffer.seek(0)
-        current_content = file_context.buffer.read()
-
-        if new_size < len(current_content):
-            # Truncate
-            file_context.buffer = BytesIO(current_content[:new_size])
-        elif new_size > len(current_content):
+        # Truncate or extend the buffer in place
+        buf = file_context.buffer
+        if new_size < len(buf):
+            del buf[new_size:]
+        elif new_size > len(buf):
             # Extend with zeros
-            file_context.buffer = BytesIO(
-                current_content + b"\x00" * (new_size - len(current_content))
-            )
+            buf.extend(bytes(new_size - len(buf)))
         # else: same size, no change needed
 
         file_context.file_size = new_size
@@ -514,7 +598,7 @@ class FTPFileSystem(BaseFileSystemOperations):
         logger.debug("overwrite: %s", file_context.path)
 
         # Reset buffer to empty
-        file_context.buffer = BytesIO()
+        file_context.buffer = bytearray()
         file_context.file_size = 0
         file_context.dirty = True
 
@@ -539,13 +623,13 @@ class FTPFileSystem(BaseFileSystemOperations):
 
         try:
             if is_directory:
-                self.ftp.create_dir(ftp_path)
+                self._create_dir(ftp_path)
                 attributes = FILE_ATTRIBUTE_DIRECTORY
             else:
-                self.ftp.create_file(ftp_path)
+                self._create_file(ftp_path)
                 attributes = FILE_ATTRIBUTE_NORMAL
 
-            self.dir_cache.invalidate_parent(ftp_path)
+            self._invalidate(ftp_path)
             now_filetime = filetime_now()
 
             ctx = OpenedContext(
@@ -556,7 +640,7 @@ class FTPFileSystem(BaseFileSystemOperations):
                 mtime_filetime=now_filetime,
             )
             if not is_directory:
-                ctx.buffer = BytesIO()
+                ctx.buffer = bytearray()
             return ctx
 
         except FileExistsError:
@@ -572,10 +656,9 @@ class FTPFileSystem(BaseFileSystemOperations):
         # Flush dirty buffers
         if file_context.dirty and file_context.buffer is not None:
             try:
-                file_context.buffer.seek(0)
-                data = file_context.buffer.read()
-                self.ftp.write_file(file_context.path, data, 0)
-                self.meta_cache.invalidate(file_context.path)
+                data = bytes(file_context.buffer)
+                self._write_file(file_context.path, data, 0)
+                self._invalidate(file_context.path)
                 file_context.dirty = False
             except Exception as e:
                 logger.warning("cleanup: flush failed for %s: %s", file_context.path, e)
@@ -586,13 +669,11 @@ class FTPFileSystem(BaseFileSystemOperations):
 
         try:
             if file_context.is_directory:
-                self.ftp.delete_dir(file_context.path)
-                self.dir_cache.invalidate(file_context.path)
+                self._delete_dir(file_context.path)
             else:
-                self.ftp.delete_file(file_context.path)
+                self._delete_file(file_context.path)
 
-            self.dir_cache.invalidate_parent(file_context.path)
-            self.meta_cache.invalidate(file_context.path)
+            self._invalidate(file_context.path)
 
         except FileNotFoundError:
             pass
@@ -618,30 +699,28 @@ class FTPFileSystem(BaseFileSystemOperations):
         try:
             if not replace_if_exists:
                 try:
-                    self.ftp.get_file_info(new_ftp_path)
+                    self._get_file_info(new_ftp_path)
                     raise NTStatusObjectNameCollision()
                 except FileNotFoundError:
                     pass
 
             if replace_if_exists:
                 try:
-                    stats = self.ftp.get_file_info(new_ftp_path)
+                    stats = self._get_file_info(new_ftp_path)
                     if stats.is_dir:
-                        self.ftp.delete_dir(new_ftp_path)
+                        self._delete_dir(new_ftp_path)
                     else:
-                        self.ftp.delete_file(new_ftp_path)
+                        self._delete_file(new_ftp_path)
                 except FileNotFoundError:
                     pass
 
-            self.ftp.rename(old_ftp_path, new_ftp_path)
+            self._rename(old_ftp_path, new_ftp_path)
 
-            self.dir_cache.invalidate_parent(old_ftp_path)
-            self.dir_cache.invalidate_parent(new_ftp_path)
-            self.meta_cache.invalidate(old_ftp_path)
-            self.meta_cache.invalidate(new_ftp_path)
-
-            if file_context.is_directory:
-                self.dir_cache.invalidate(old_ftp_path)
+            self._invalidate(old_ftp_path, new_ftp_path)
+            # A directory rename (or a replaced directory) moves its whole subtree
+            for ftp_path in (old_ftp_path, new_ftp_path):
+                self.meta_cache.invalidate_tree(ftp_path)
+                self.dir_cache.invalidate_tree(ftp_path)
 
             file_context.path = new_ftp_path
 
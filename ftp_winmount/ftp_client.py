@@ -1,26 +1,99 @@
 import ftplib
 import logging
 import socket
+import ssl
 import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 
+from .cache import DirectoryCache, MetadataCache, parent_path
 from .config import ConnectionConfig, FTPConfig
+from .listing import FileStats, parse_facts, parse_list_line, parse_mlsd_entry
+from .pool import FTPPool, shared_pool
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class FileStats:
-    """Standardized file statistics independent of OS"""
+@lru_cache(maxsize=32)
+def _parse_feat(response: str) -> frozenset[str]:
+    """
+    Extract feature names from a multi-line FEAT reply.
+
+    Each line between the "211-" header and the "211 End" trailer names one
+    feature, optionally followed by parameters ("REST STREAM", "MLST type*;").
+    """
+    lines = response.splitlines()[1:-1]
+    return frozenset(line.split()[0].upper() for line in lines if line.strip())
+
+
+# Stat cache marker for paths the server reported as missing
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_path(path: str) -> str:
+    """
+    Ensure path has leading slash and uses forward slashes.
+
+    Memoized like filesystem._to_ftp_path: every client call normalizes its
+    path, and the same few paths recur across calls.
+    """
+    path = path.replace("\\", "/")
+    if not path.startswith("/"):
+        path = "/" + path
+    return path
+
+
+# Reply text that explicitly says a path does not exist
+_MISSING_MARKERS = ("not found", "no such", "doesn't exist", "does not exist")
+
+
+def _says_missing(message: str) -> bool:
+    """Whether an FTP error reply states that its path does not exist."""
+    lowered = message.lower()
+    return any(marker in lowered for marker in _MISSING_MARKERS)
 
-    name: str
-    size: int
-    mtime: datetime
-    is_dir: bool
-    attributes: int = 0  # Windows file attributes
+
+def _classify_550(message: str) -> Exception:
+    """550 covers both missing paths and refusals; only the text tells them apart."""
+    if _says_missing(message):
+        return FileNotFoundError(message)
+    lowered = message.lower()
+    if "permission" in lowered or "denied" in lowered:
+        return PermissionError(message)
+    if "not empty" in lowered:
+        return OSError(message)  # Directory not empty
+    # Default to FileNotFoundError for 550
+    return FileNotFoundError(message)
+
+
+def _auth_required(message: str) -> Exception:
+    return PermissionError(f"Authentication required: {message}")
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """
+    Whether a failed operation is worth retrying on a fresh connection.
+
+    4xx replies and dropped/timed-out connections are transient. 5xx replies
+    and "not found" results raised by the client itself are permanent.
+    """
+    if isinstance(exc, FileNotFoundError):
+        return False
+    if isinstance(exc, (OSError, EOFError, ftplib.error_temp)):
+        return True
+    return isinstance(exc, ftplib.error_reply) and str(exc)[:1] == "4"
+
+
+# Permanent reply codes with a more specific exception than OSError
+_CODE_TO_EXC: dict[int, Callable[[str], Exception]] = {
+    550: _classify_550,
+    553: PermissionError,
+    530: _auth_required,
+}
 
 
 class FTPClient:
@@ -29,16 +102,38 @@ class FTPClient:
     retry logic, and simplified API.
     """
 
-    def __init__(self, ftp_config: FTPConfig, conn_config: ConnectionConfig):
+    def __init__(
+        self,
+        ftp_config: FTPConfig,
+        conn_config: ConnectionConfig,
+        pool: FTPPool | None = None,
+    ):
         self.ftp_config = ftp_config
         self.conn_config = conn_config
+        # Pool is only used when conn_config.pool_size allows idle connections
+        self._pool = pool if pool is not None else shared_pool
+        # Everything applied while connecting and logging in; a pooled session
+        # is reused as-is, so it must have been set up with the same values
+        self._pool_key = (
+            ftp_config.host,
+            ftp_config.port,
+            ftp_config.username,
+            ftp_config.password,
+            ftp_config.secure,
+            ftp_config.passive_mode,
+            ftp_config.encoding,
+        )
         self._ftp: ftplib.FTP | None = None
         self._lock = threading.Lock()
         self._connected = False
         # Track server capabilities
+        self._features: frozenset[str] | None = None
         self._supports_mlsd = None
         self._supports_mlst = None
         self._supports_rest = None
+        # Short-lived stat/listing results, invalidated by this client's own writes
+        self._stat_cache = MetadataCache(conn_config.stat_cache_ttl_seconds)
+        self._listdir_cache = DirectoryCache(conn_config.stat_cache_ttl_seconds)
 
     def connect(self) -> None:
         """
@@ -50,6 +145,15 @@ class FTPClient:
 
     def _connect_internal(self) -> None:
         """Internal connect without lock - caller must hold lock."""
+        if self.conn_config.pool_size > 0:
+            pooled = self._pool.acquire(self._pool_key)
+            if pooled is not None:
+                self._ftp = pooled
+                self._connected = True
+                logger.debug("Reusing pooled connection to %s", self.ftp_config.host)
+                self._probe_capabilities()
+                return
+
         try:
             # Create FTP instance with timeout - use FTP_TLS for secure connections
             if self.ftp_config.secure:
@@ -120,19 +224,22 @@ class FTPClient:
         if not self._ftp:
             return
 
+        if self._features is not None:
+            # Capabilities belong to the server, so a reconnect reuses them
+            return
+
         try:
             # Check FEAT response for capabilities
-            features = []
             try:
-                resp = self._ftp.sendcmd("FEAT")
-                features = resp.upper().split()
+                features = _parse_feat(self._ftp.sendcmd("FEAT"))
             except ftplib.error_perm:
                 # Server doesn't support FEAT
-                pass
+                features = frozenset()
 
+            self._features = features
             self._supports_mlsd = "MLSD" in features
             self._supports_mlst = "MLST" in features
-            self._supports_rest = "REST" in features or "REST STREAM" in " ".join(features)
+            self._supports_rest = "REST" in features
 
             logger.debug(
                 "Server capabilities - MLSD: %s, MLST: %s, REST: %s",
@@ -148,8 +255,13 @@ class FTPClient:
             self._supports_rest = False
 
     def disconnect(self) -> None:
-        """Safely close connection(s)."""
+        """Safely close connection(s), or hand a healthy one back to the pool."""
         with self._lock:
+            if self.conn_config.pool_size > 0 and self._ftp and self._connected:
+                self._pool.release(self._pool_key, self._ftp, self.conn_config.pool_size)
+                self._ftp = None
+                self._connected = False
+                return
             self._disconnect_internal()
 
     def _disconnect_internal(self) -> None:
@@ -183,12 +295,14 @@ class FTPClient:
             self._disconnect_internal()
             self._connect_internal()
 
+    def _invalidate(self, *paths: str) -> None:
+        """Drop cached stats for paths and cached listings of them and their parents."""
+        self._stat_cache.invalidate_many(paths)
+        self._listdir_cache.invalidate_many([*paths, *map(parent_path, paths)])
+
     def _normalize_path(self, path: str) -> str:
         """Ensure path has leading slash and uses forward slashes."""
-        path = path.replace("\\", "/")
-        if not path.startswith("/"):
-            path = "/" + path
-        return path
+        return _normalize_path(path)
 
     def _with_retry(self, operation: str, func, *args, **kwargs):
         """
@@ -212,7 +326,12 @@ class FTPClient:
                 with self._lock:
                     self._ensure_connected()
                     return func(*args, **kwargs)
-            except (TimeoutError, ftplib.error_temp, OSError, ConnectionError) as e:
+            except ftplib.error_perm as e:
+                # Permanent errors should not be retried
+                raise self._translate_ftp_error(e)
+            except Exception as e:
+                if not _is_retryable(e):
+                    raise
                 last_exception = e
                 logger.warning(
                     "%s failed (attempt %d/%d): %s",
@@ -227,9 +346,6 @@ class FTPClient:
                     # Force reconnect on next attempt
                     with self._lock:
                         self._disconnect_internal()
-            except ftplib.error_perm as e:
-                # Permanent errors should not be retried
-                raise self._translate_ftp_error(e)
 
         # All retries exhausted
         logger.error("%s failed after %d attempts", operation, self.conn_config.retry_attempts)
@@ -239,26 +355,12 @@ class FTPClient:
 
     def _translate_ftp_error(self, error: ftplib.error_perm) -> Exception:
         """Translate FTP permanent errors to standard Python exceptions."""
-        error_str = str(error).lower()
-        error_code = str(error)[:3] if len(str(error)) >= 3 else ""
-
-        if error_code == "550":
-            # Could be file not found or permission denied
-            if "not found" in error_str or "no such" in error_str or "doesn't exist" in error_str:
-                return FileNotFoundError(str(error))
-            elif "permission" in error_str or "denied" in error_str:
-                return PermissionError(str(error))
-            elif "not empty" in error_str:
-                return OSError(str(error))  # Directory not empty
-            else:
-                # Default to FileNotFoundError for 550
-                return FileNotFoundError(str(error))
-        elif error_code == "553":
-            return PermissionError(str(error))
-        elif error_code == "530":
-            return PermissionError(f"Authentication required: {error}")
-        else:
-            return OSError(str(error))
+        message = str(error)
+        try:
+            code = int(message[:3])
+        except ValueError:
+            return OSError(message)
+        return _CODE_TO_EXC.get(code, OSError)(message)
 
     def list_dir(self, path: str) -> list[FileStats]:
         """
@@ -275,13 +377,31 @@ class FTPClient:
             PermissionError: If access denied.
         """
         path = self._normalize_path(path)
+        cached = self._listdir_cache.get(path)
+        if cached is not None:
+            return list(cached)
         logger.debug("Listing directory: %s", path)
 
         def _list_dir_internal() -> list[FileStats]:
+            # Another thread may have listed the same path while this one
+            # waited for the connection; reuse its result
+            cached = self._listdir_cache.get(path)
+            if cached is not None:
+                return list(cached)
             if self._supports_mlsd:
-                return self._list_dir_mlsd(path)
+                results = self._list_dir_mlsd(path)
             else:
-                return self._list_dir_list(path)
+                results = self._list_dir_list(path)
+            # Cached while still holding the connection lock, so waiters see it
+            if self.conn_config.stat_cache_ttl_seconds > 0:
+                self._listdir_cache.put(path, results)
+                # The listing already carries each child's stats, so a stat
+                # that follows it needs no MLST round-trip
+                prefix = path.rstrip("/") + "/"
+                for stats in results:
+                    self._stat_cache.put(prefix + stats.name, stats)
+                results = list(results)
+            return results
 
         return self._with_retry(f"list_dir({path})", _list_dir_internal)
 
@@ -292,33 +412,11 @@ class FTPClient:
             # Skip . and .. entries
             if name in (".", ".."):
                 continue
-
-            is_dir = facts.get("type", "").lower() in ("dir", "cdir", "pdir")
-            size = int(facts.get("size", 0)) if not is_dir else 0
-
-            # Parse modify time
-            mtime_str = facts.get("modify", "")
-            mtime = self._parse_mlsd_time(mtime_str)
-
-            results.append(FileStats(name=name, size=size, mtime=mtime, is_dir=is_dir))
+            results.append(parse_mlsd_entry(name, facts))
 
         logger.debug("MLSD listed %d entries in %s", len(results), path)
         return results
 
-    def _parse_mlsd_time(self, time_str: str) -> datetime:
-        """Parse MLSD modify time format (YYYYMMDDHHmmSS or YYYYMMDDHHmmSS.sss)."""
-        if not time_str:
-            return datetime.now()
-
-        try:
-            # Remove fractional seconds if present
-            if "." in time_str:
-                time_str = time_str.split(".")[0]
-            return datetime.strptime(time_str, "%Y%m%d%H%M%S")
-        except ValueError:
-            logger.warning("Failed to parse MLSD time: %s", time_str)
-            return datetime.now()
-
     def _list_dir_list(self, path: str) -> list[FileStats]:
         """List directory using LIST command (legacy, needs parsing)."""
         lines = []
@@ -327,162 +425,13 @@ class FTPClient:
 
         results = []
         for line in lines:
-            stats = self._parse_list_line(line)
+            stats = parse_list_line(line)
             if stats and stats.name not in (".", ".."):
                 results.append(stats)
 
         logger.debug("LIST listed %d entries in %s", len(results), path)
         return results
 
-    def _parse_list_line(self, line: str) -> FileStats | None:
-        """
-        Parse a single line from LIST output.
-        Handles both Unix and Windows FTP server formats.
-        """
-        line = line.strip()
-        if not line:
-            return None
-
-        # Try Unix format: drwxr-xr-x  2 user group 4096 Dec 10 12:34 filename
-        # Try Windows format: 12-10-20  12:34PM       <DIR>          dirname
-        # Try Windows format: 12-10-20  12:34PM              1234 filename
-
-        parts = line.split()
-        if len(parts) < 4:
-            return None
-
-        # Check for Unix format (starts with permissions like drwxr-xr-x or -rw-r--r--)
-        if len(parts[0]) >= 10 and parts[0][0] in "dl-":
-            return self._parse_unix_list_line(parts, line)
-
-        # Check for Windows format (starts with date like MM-DD-YY)
-        if "-" in parts[0] and len(parts[0]) <= 10:
-            return self._parse_windows_list_line(parts, line)
-
-        logger.warning("Unknown LIST format: %s", line)
-        return None
-
-    def _parse_unix_list_line(self, parts: list[str], original_line: str) -> FileStats | None:
-        """Parse Unix-style LIST output."""
-        try:
-            is_dir = parts[0][0] == "d"
-            size = int(parts[4]) if not is_dir else 0
-
-            # Filename is everything after the date/time (parts 5-7 typically)
-            # Find the position after the size field
-            size_end_pos = original_line.find(parts[4]) + len(parts[4])
-            # Skip whitespace after size
-            name_start = size_end_pos
-            while name_start < len(original_line) and original_line[name_start] in " \t":
-                name_start += 1
-            # Skip month day time fields (3 fields)
-            for _ in range(3):
-                while name_start < len(original_line) and original_line[name_start] not in " \t":
-                    name_start += 1
-                while name_start < len(original_line) and original_line[name_start] in " \t":
-                    name_start += 1
-
-            name = original_line[name_start:].strip()
-
-            # Parse modification time (month day time/year)
-            mtime = self._parse_unix_list_time(parts[5:8])
-
-            return FileStats(name=name, size=size, mtime=mtime, is_dir=is_dir)
-        except (IndexError, ValueError) as e:
-            logger.warning("Failed to parse Unix LIST line: %s - %s", original_line, e)
-            return None
-
-    def _parse_unix_list_time(self, time_parts: list[str]) -> datetime:
-        """Parse Unix LIST time format (e.g., 'Dec 10 12:34' or 'Dec 10  2020')."""
-        if len(time_parts) < 3:
-            return datetime.now()
-
-        month_str, day_str, time_or_year = time_parts[0], time_parts[1], time_parts[2]
-
-        months = {
-            "jan": 1,
-            "feb": 2,
-            "mar": 3,
-            "apr": 4,
-            "may": 5,
-            "jun": 6,
-            "jul": 7,
-            "aug": 8,
-            "sep": 9,
-            "oct": 10,
-            "nov": 11,
-            "dec": 12,
-        }
-
-        try:
-            month = months.get(month_str.lower(), 1)
-            day = int(day_str)
-
-            if ":" in time_or_year:
-                # Time format - assume current year
-                hour, minute = map(int, time_or_year.split(":"))
-                year = datetime.now().year
-            else:
-                # Year format - assume midnight
-                year = int(time_or_year)
-                hour, minute = 0, 0
-
-            return datetime(year, month, day, hour, minute)
-        except (ValueError, KeyError):
-            return datetime.now()
-
-    def _parse_windows_list_line(self, parts: list[str], original_line: str) -> FileStats | None:
-        """Parse Windows-style LIST output."""
-        try:
-            # Format: MM-DD-YY  HH:MMPM  <DIR>  dirname
-            # Format: MM-DD-YY  HH:MMPM  size  filename
-            is_dir = "<DIR>" in original_line
-            size = 0
-            name_start_idx = 3
-
-            if is_dir:
-                # Find <DIR> and name after it
-                dir_idx = parts.index("<DIR>")
-                name_start_idx = dir_idx + 1
-            else:
-                # Size is the third element
-                size = int(parts[2])
-                name_start_idx = 3
-
-            # Name is everything after size/<DIR>
-            name = " ".join(parts[name_start_idx:])
-
-            # Parse date/time
-            mtime = self._parse_windows_list_time(parts[0], parts[1])
-
-            return FileStats(name=name, size=size, mtime=mtime, is_dir=is_dir)
-        except (IndexError, ValueError) as e:
-            logger.warning("Failed to parse Windows LIST line: %s - %s", original_line, e)
-            return None
-
-    def _parse_windows_list_time(self, date_str: str, time_str: str) -> datetime:
-        """Parse Windows LIST time format (MM-DD-YY HH:MMAM/PM)."""
-        try:
-            # Parse date
-            month, day, year = map(int, date_str.split("-"))
-            if year < 100:
-                year += 2000 if year < 70 else 1900
-
-            # Parse time
-            time_str = time_str.upper()
-            is_pm = "PM" in time_str
-            time_str = time_str.replace("AM", "").replace("PM", "")
-            hour, minute = map(int, time_str.split(":"))
-
-            if is_pm and hour != 12:
-                hour += 12
-            elif not is_pm and hour == 12:
-                hour = 0
-
-            return datetime(year, month, day, hour, minute)
-        except (ValueError, IndexError):
-            return datetime.now()
-
     def get_file_info(self, path: str) -> FileStats:
         """
         Get metadata for a single file or directory.
@@ -494,13 +443,40 @@ class FTPClient:
             FileStats object.
         """
         path = self._normalize_path(path)
+        cached = self._stat_cache.get(path)
+        if cached is _MISSING:
+            raise FileNotFoundError(f"File not found: {path}")
+        if cached is not None:
+            return cached
         logger.debug("Getting file info: %s", path)
 
         def _get_file_info_internal() -> FileStats:
-            if self._supports_mlst:
-                return self._get_file_info_mlst(path)
-            else:
-                return self._get_file_info_list(path)
+            # Same re-check as list_dir for concurrent stats of one path
+            cached = self._stat_cache.get(path)
+            if cached is _MISSING:
+                raise FileNotFoundError(f"File not found: {path}")
+            if cached is not None:
+                return cached
+            try:
+                if self._supports_mlst:
+                    stats = self._get_file_info_mlst(path)
+                else:
+                    stats = self._get_file_info_list(path)
+            except ftplib.error_perm as e:
+                # Existence probes for absent files repeat; remember a server
+                # "not found" too. Stored under the connection lock so it
+                # cannot overwrite the invalidation of a later create.
+                message = str(e)
+                if (
+                    self.conn_config.stat_cache_ttl_seconds > 0
+                    and message.startswith("550")
+                    and isinstance(_classify_550(message), FileNotFoundError)
+                ):
+                    self._stat_cache.put(path, _MISSING)
+                raise
+            if self.conn_config.stat_cache_ttl_seconds > 0:
+                self._stat_cache.put(path, stats)
+            return stats
 
         return self._with_retry(f"get_file_info({path})", _get_file_info_internal)
 
@@ -513,31 +489,17 @@ class FTPClient:
         #  type=file;size=1234;modify=20201210123456; filename
         # 250 End
 
-        for line in response.split("\n"):
-            line = line.strip()
-            if line.startswith(" ") or ";" in line:
-                # This is the facts line
-                parts = line.strip().split(";")
-                facts = {}
-                name = ""
-
-                for part in parts:
-                    if "=" in part:
-                        key, value = part.split("=", 1)
-                        facts[key.lower()] = value
-                    else:
-                        # Last part without = is the filename
-                        name = part.strip()
-
-                if not name:
-                    # Filename might be the path itself
-                    name = path.rsplit("/", 1)[-1]
-
-                is_dir = facts.get("type", "").lower() in ("dir", "cdir", "pdir")
-                size = int(facts.get("size", 0)) if not is_dir else 0
-                mtime = self._parse_mlsd_time(facts.get("modify", ""))
+        for line in response.splitlines():
+            # Only the facts line starts with a space and carries "name=value;" pairs
+            if not line.startswith(" ") and "type=" not in line:
+                continue
+            # Facts never contain spaces; the pathname follows the first one
+            facts_str, _, name = line.strip().partition(" ")
+            if not name:
+                # Filename might be the path itself
+                name = path.rsplit("/", 1)[-1]
 
-                return FileStats(name=name, size=size, mtime=mtime, is_dir=is_dir)
+            return parse_mlsd_entry(name, parse_facts(facts_str))
 
         raise FileNotFoundError(f"Could not parse MLST response for {path}")
 
@@ -578,9 +540,12 @@ class FTPClient:
         """
         path = self._normalize_path(path)
         logger.debug("Reading file: %s (offset=%d, length=%s)", path, offset, length)
+        if length == 0:
+            return b""
 
         def _read_file_internal() -> bytes:
-            buffer = BytesIO()
+            # bytearray.extend is the cheapest per-chunk callback for pure accumulation
+            buffer = bytearray()
 
             # Track whether REST actually succeeded for this request
             rest_used = False
@@ -601,22 +566,55 @@ class FTPClient:
                     self._supports_rest = False
                     rest_used = False
 
-            # Download file
-            self._ftp.retrbinary(f"RETR {path}", buffer.write)
-            data = buffer.getvalue()
+            # Apply offset if REST wasn't used for this request, then length,
+            # copying the requested range out exactly once
+            start = offset if offset > 0 and not rest_used else 0
+            end = start + length if length is not None else None
 
-            # Apply offset if REST wasn't used for this request
-            if offset > 0 and not rest_used:
-                data = data[offset:]
+            # Download file, stopping as soon as a ranged read has its bytes
+            if end is None:
+                self._ftp.retrbinary(
+                    f"RETR {path}", buffer.extend, blocksize=self.ftp_config.transfer_block_size
+                )
+            else:
+                self._retr_prefix(path, buffer, end)
 
-            if length is not None:
-                data = data[:length]
+            with memoryview(buffer) as view:
+                data = bytes(view[start:end])
 
             logger.debug("Read %d bytes from %s", len(data), path)
             return data
 
         return self._with_retry(f"read_file({path})", _read_file_internal)
 
+    def _retr_prefix(self, path: str, buffer: bytearray, limit: int) -> None:
+        """
+        RETR into buffer until it holds limit bytes, then drop the data connection.
+
+        Caller must hold lock. The server answers an early close with 426 (or
+        226 if it had already sent everything), and either reply ends the
+        transfer, so no ABOR is needed.
+        """
+        block_size = self.ftp_config.transfer_block_size
+        complete = False
+        self._ftp.voidcmd("TYPE I")
+        with self._ftp.transfercmd(f"RETR {path}") as conn:
+            while len(buffer) < limit:
+                chunk = conn.recv(min(block_size, limit - len(buffer)))
+                if not chunk:
+                    complete = True
+                    break
+                buffer.extend(chunk)
+            # FTPS: shut TLS down cleanly at EOF, as retrbinary does
+            if complete and isinstance(conn, ssl.SSLSocket):
+                conn.unwrap()
+        try:
+            self._ftp.voidresp()
+        except ftplib.error_temp as e:
+            if complete:
+                raise
+            logger.debug("Ranged read of %s stopped early: %s", path, e)
+
     def write_file(self, path: str, data: bytes, offset: int = 0) -> int:
         """
         Write bytes to a file.
@@ -636,16 +634,43 @@ class FTPClient:
             if offset == 0:
                 # Simple case: write entire file
                 buffer = BytesIO(data)
-                self._ftp.storbinary(f"STOR {path}", buffer)
+                self._ftp.storbinary(
+                    f"STOR {path}", buffer, blocksize=self.ftp_config.transfer_block_size
+                )
                 logger.debug("Wrote %d bytes to %s", len(data), path)
                 return len(data)
             else:
+                size = self._remote_size(path)
+                block_size = self.ftp_config.transfer_block_size
+
+                if size == offset:
+                    # Append: only the new bytes cross the wire
+                    self._ftp.storbinary(f"APPE {path}", BytesIO(data), blocksize=block_size)
+                    logger.debug("Appended %d bytes to %s", len(data), path)
+                    return len(data)
+
+                if size is not None and self._supports_rest and offset < size <= offset + len(data):
+                    # The write covers the tail, so restarting the upload at
+                    # offset leaves the same file as a full rewrite would
+                    try:
+                        self._ftp.storbinary(
+                            f"STOR {path}", BytesIO(data), blocksize=block_size, rest=offset
+                        )
+                        logger.debug("Wrote %d bytes to %s at offset %d", len(data), path, offset)
+                        return len(data)
+                    except ftplib.error_perm as e:
+                        # Many servers refuse REST before STOR; rewrite instead
+                        logger.debug("REST+STOR refused for %s: %s", path, e)
+
                 # Complex case: read-modify-write
                 # First, read existing file
+                existing_data = bytearray()
                 try:
-                    existing_buffer = BytesIO()
-                    self._ftp.retrbinary(f"RETR {path}", existing_buffer.write)
-                    existing_data = bytearray(existing_buffer.getvalue())
+                    self._ftp.retrbinary(
+                        f"RETR {path}",
+                        existing_data.extend,
+                        blocksize=self.ftp_config.transfer_block_size,
+                    )
                 except ftplib.error_perm:
                     # File doesn't exist, create with padding
                     existing_data = bytearray()
@@ -658,12 +683,25 @@ class FTPClient:
                 existing_data[offset : offset + len(data)] = data
 
                 # Write back
-                buffer = BytesIO(bytes(existing_data))
-                self._ftp.storbinary(f"STOR {path}", buffer)
+                buffer = BytesIO(existing_data)
+                self._ftp.storbinary(
+                    f"STOR {path}", buffer, blocksize=self.ftp_config.transfer_block_size
+                )
                 logger.debug("Wrote %d bytes to %s at offset %d", len(data), path, offset)
                 return len(data)
 
-        return self._with_retry(f"write_file({path})", _write_file_internal)
+        try:
+            return self._with_retry(f"write_file({path})", _write_file_internal)
+        finally:
+            self._invalidate(path)
+
+    def _remote_size(self, path: str) -> int | None:
+        """SIZE of a file in binary mode, or None if unknown. Caller must hold lock."""
+        try:
+            self._ftp.voidcmd("TYPE I")
+            return self._ftp.size(path)
+        except ftplib.error_perm:
+            return None
 
     def create_file(self, path: str) -> None:
         """Create an empty file."""
@@ -675,43 +713,52 @@ class FTPClient:
             self._ftp.storbinary(f"STOR {path}", buffer)
             logger.debug("Created empty file: %s", path)
 
-        self._with_retry(f"create_file({path})", _create_file_internal)
+        try:
+            self._with_retry(f"create_file({path})", _create_file_internal)
+        finally:
+            self._invalidate(path)
 
     def create_dir(self, path: str) -> None:
         """Create a directory (recursively if needed)."""
         path = self._normalize_path(path)
         logger.debug("Creating directory: %s", path)
 
-        def _create_dir_internal() -> None:
-            # Try to create directly first
+        def _mkd(target: str) -> None:
+            # Deepest path first: usually only the leaf is missing, so one MKD
+            # succeeds without probing any ancestors
             try:
-                self._ftp.mkd(path)
-                logger.debug("Created directory: %s", path)
+                self._ftp.mkd(target)
+                logger.debug("Created directory: %s", target)
                 return
             except ftplib.error_perm as e:
-                # Directory might already exist, or parent doesn't exist
                 error_str = str(e).lower()
                 if "exists" in error_str or "already" in error_str:
-                    logger.debug("Directory already exists: %s", path)
+                    logger.debug("Directory already exists: %s", target)
                     return
-                # Otherwise, try creating parent directories
-                pass
-
-            # Create parent directories recursively
-            parts = path.strip("/").split("/")
-            current = ""
-            for part in parts:
-                current = current + "/" + part
-                try:
-                    self._ftp.mkd(current)
-                    logger.debug("Created directory: %s", current)
-                except ftplib.error_perm as e:
-                    # Already exists, continue
-                    error_str = str(e).lower()
-                    if "exists" not in error_str and "already" not in error_str:
-                        raise
+                parent = target.rpartition("/")[0]
+                # Only a reply that says "no such file" points at a missing
+                # parent; refusals and generic failures belong to target
+                if not error_str.startswith("550") or not parent or not _says_missing(error_str):
+                    raise
 
-        self._with_retry(f"create_dir({path})", _create_dir_internal)
+            # Parent is missing - create it, then retry this level
+            _mkd(parent)
+            self._ftp.mkd(target)
+            logger.debug("Created directory: %s", target)
+
+        def _create_dir_internal() -> None:
+            _mkd(path)
+
+        try:
+            self._with_retry(f"create_dir({path})", _create_dir_internal)
+        finally:
+            # Missing ancestors may have been created along the way
+            ancestors = []
+            current = path
+            while current != "/":
+                ancestors.append(current)
+                current = parent_path(current)
+            self._invalidate(*ancestors)
 
     def delete_file(self, path: str) -> None:
         """Delete a file."""
@@ -722,7 +769,10 @@ class FTPClient:
             self._ftp.delete(path)
             logger.debug("Deleted file: %s", path)
 
-        self._with_retry(f"delete_file({path})", _delete_file_internal)
+        try:
+            self._with_retry(f"delete_file({path})", _delete_file_internal)
+        finally:
+            self._invalidate(path)
 
     def delete_dir(self, path: str) -> None:
         """Delete a directory (must be empty)."""
@@ -733,7 +783,10 @@ class FTPClient:
             self._ftp.rmd(path)
             logger.debug("Deleted directory: %s", path)
 
-        self._with_retry(f"delete_dir({path})", _delete_dir_internal)
+        try:
+            self._with_retry(f"delete_dir({path})", _delete_dir_internal)
+        finally:
+            self._invalidate(path)
 
     def rename(self, old_path: str, new_path: str) -> None:
         """Rename or move a file/directory."""
@@ -745,4 +798,11 @@ class FTPClient:
             self._ftp.rename(old_path, new_path)
             logger.debug("Renamed: %s -> %s", old_path, new_path)
 
-        self._with_retry(f"rename({old_path}, {new_path})", _rename_internal)
+        try:
+            self._with_retry(f"rename({old_path}, {new_path})", _rename_internal)
+        finally:
+            # A renamed directory moves every cached path beneath it
+            self._invalidate(old_path, new_path)
+            for path in (old_path, new_path):
+                self._stat_cache.invalidate_tree(path)
+                self._listdir_cache.invalidate_tree(path)
@@ -0,0 +1,210 @@
+"""
+Parsing of FTP directory listings.
+
+Pure functions that turn MLSD/MLST facts and LIST output lines into
+FileStats objects. They hold no connection state, so FTPClient calls them
+on the raw server responses and tests can exercise them directly.
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Unix: drwxr-xr-x  2 user group 4096 Dec 10 12:34 filename
+# Groups: type, size, month, day, time-or-year, name
+# The month is any token so localized names (e.g. "janv.") still parse
+_UNIX_TYPE_CHARS = "-dlbcps"
+_UNIX_LIST_RE = re.compile(
+    r"([-dlbcps])[-rwxsStT]{9}\S*\s+\d+\s+\S+\s+\S+\s+(\d+)\s+"
+    r"(\S+)\s+(\d{1,2})\s+(\d{1,2}:\d{2}|\d{4})\s+(.+)",
+    re.ASCII,
+)
+
+# Windows: 12-10-20  12:34PM       <DIR>          dirname
+#          12-10-20  12:34PM              1234 filename
+#          12-10-20  14:34                1234 filename  (24-hour clock)
+# Groups: date, time, size-or-<DIR>, name
+_WINDOWS_LIST_RE = re.compile(
+    r"(\d{1,2}-\d{1,2}-\d{2,4})\s+(\d{1,2}:\d{2}(?:\s*[AaPp][Mm])?)\s+(<DIR>|\d+)\s+(.+)",
+    re.ASCII,
+)
+
+# 100-nanosecond intervals between 1601-01-01 (FILETIME epoch) and 1970-01-01
+FILETIME_EPOCH_DIFF = 116444736000000000
+
+
+@dataclass
+class FileStats:
+    """Standardized file statistics independent of OS"""
+
+    name: str
+    size: int
+    mtime: datetime
+    is_dir: bool
+    attributes: int = 0  # Windows file attributes
+    _filetime: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def filetime(self) -> int:
+        """Return mtime as a Windows FILETIME integer, computed once per instance."""
+        if self._filetime is None:
+            timestamp = self.mtime.timestamp() if self.mtime is not None else time.time()
+            self._filetime = int(timestamp * 10000000) + FILETIME_EPOCH_DIFF
+        return self._filetime
+
+
+def parse_mlsd_time(time_str: str) -> datetime:
+    """Parse MLSD modify time format (YYYYMMDDHHmmSS or YYYYMMDDHHmmSS.sss)."""
+    if not time_str:
+        return datetime.now()
+
+    # Remove fractional seconds if present
+    digits = time_str.partition(".")[0]
+    # Fixed-width fields; slicing is much cheaper than strptime per entry
+    if len(digits) == 14 and digits.isdigit():
+        try:
+            return datetime(
+                int(digits[0:4]),
+                int(digits[4:6]),
+                int(digits[6:8]),
+                int(digits[8:10]),
+                int(digits[10:12]),
+                int(digits[12:14]),
+            )
+        except ValueError:
+            pass
+    logger.warning("Failed to parse MLSD time: %s", time_str)
+    return datetime.now()
+
+
+def parse_facts(raw: str) -> dict[str, str]:
+    """
+    Parse an MLSx facts string ("type=file;size=1024;modify=...;").
+
+    Returns:
+        Lower-cased fact names mapped to their values.
+    """
+    facts = {}
+    for part in raw.split(";"):
+        key, sep, value = part.partition("=")
+        if sep:
+            facts[key.lower()] = value
+    return facts
+
+
+def parse_mlsd_entry(name: str, facts: dict[str, str]) -> FileStats:
+    """
+    Build FileStats from one MLSD/MLST entry.
+
+    Args:
+        name: Entry name as sent by the server.
+        facts: Lower-cased fact names mapped to their values.
+    """
+    is_dir = facts.get("type", "").lower() in ("dir", "cdir", "pdir")
+    size = int(facts.get("size", 0)) if not is_dir else 0
+    mtime = parse_mlsd_time(facts.get("modify", ""))
+    return FileStats(name=name, size=size, mtime=mtime, is_dir=is_dir)
+
+
+def parse_list_line(line: str) -> FileStats | None:
+    """
+    Parse a single line from LIST output.
+    Handles both Unix and Windows FTP server formats.
+
+    Returns:
+        FileStats, or None if the line is blank or in an unknown format.
+    """
+    line = line.strip()
+    if not line:
+        return None
+
+    # Unix lines start with the permission string, Windows lines with a date
+    if line[0] in _UNIX_TYPE_CHARS:
+        m = _UNIX_LIST_RE.match(line)
+        if m:
+            type_char, size, month, day, time_or_year, name = m.groups()
+            is_dir = type_char == "d"
+            mtime = _parse_unix_list_time([month, day, time_or_year])
+            return FileStats(name=name, size=0 if is_dir else int(size), mtime=mtime, is_dir=is_dir)
+    elif line[0].isdigit():
+        m = _WINDOWS_LIST_RE.match(line)
+        if m:
+            date_str, time_str, size, name = m.groups()
+            is_dir = size == "<DIR>"
+            mtime = _parse_windows_list_time(date_str, time_str)
+            return FileStats(name=name, size=0 if is_dir else int(size), mtime=mtime, is_dir=is_dir)
+    elif line.startswith("total "):
+        # Block count summary printed by Unix servers before the entries
+        return None
+
+    logger.warning("Unknown LIST format: %s", line)
+    return None
+
+
+def _parse_unix_list_time(time_parts: list[str]) -> datetime:
+    """Parse Unix LIST time format (e.g., 'Dec 10 12:34' or 'Dec 10  2020')."""
+    if len(time_parts) < 3:
+        return datetime.now()
+
+    month_str, day_str, time_or_year = time_parts[0], time_parts[1], time_parts[2]
+
+    months = {
+        "jan": 1,
+        "feb": 2,
+        "mar": 3,
+        "apr": 4,
+        "may": 5,
+        "jun": 6,
+        "jul": 7,
+        "aug": 8,
+        "sep": 9,
+        "oct": 10,
+        "nov": 11,
+        "dec": 12,
+    }
+
+    try:
+        month = months.get(month_str.lower(), 1)
+        day = int(day_str)
+
+        if ":" in time_or_year:
+            # Time format - assume current year
+            hour, minute = map(int, time_or_year.split(":"))
+            year = datetime.now().year
+        else:
+            # Year format - assume midnight
+            year = int(time_or_year)
+            hour, minute = 0, 0
+
+        return datetime(year, month, day, hour, minute)
+    except (ValueError, KeyError):
+        return datetime.now()
+
+
+def _parse_windows_list_time(date_str: str, time_str: str) -> datetime:
+    """Parse Windows LIST time format (MM-DD-YY HH:MMAM/PM or 24-hour HH:MM)."""
+    try:
+        # Parse date
+        month, day, year = map(int, date_str.split("-"))
+        if year < 100:
+            year += 2000 if year < 70 else 1900
+
+        # Parse time
+        time_str = time_str.upper()
+        is_pm = "PM" in time_str
+        is_am = "AM" in time_str
+        time_str = time_str.replace("AM", "").replace("PM", "")
+        hour, minute = map(int, time_str.split(":"))
+
+        # Without a suffix the hour is already on a 24-hour clock
+        if is_pm and hour != 12:
+            hour += 12
+        elif is_am and hour == 12:
+            hour = 0
+
+        return datetime(year, month, day, hour, minute)
+    except (ValueError, IndexError):
+        return datetime.now()
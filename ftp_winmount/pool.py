@@ -0,0 +1,106 @@
+"""
+Process-wide pool of logged-in FTP control connections.
+
+Connecting costs a TCP handshake, optional TLS negotiation, USER/PASS and
+PASV setup. When FTPClient instances for the same server come and go (mount
+verification, scripted use, tests), handing an idle session to the next
+client skips all of that.
+"""
+
+import ftplib
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Idle connections older than this are assumed to have been dropped by the
+# server and are closed instead of reused
+IDLE_TIMEOUT_SECONDS = 60
+
+# (host, port, username, password, secure, passive_mode, encoding): every
+# setting a session is connected and logged in with
+PoolKey = tuple[str, int, str | None, str | None, bool, bool, str]
+
+
+def _close(ftp: ftplib.FTP) -> None:
+    """Close a connection, ignoring errors from an already-dead socket."""
+    try:
+        ftp.quit()
+    except Exception:
+        try:
+            ftp.close()
+        except Exception:
+            pass
+
+
+class FTPPool:
+    """
+    Idle FTP connections keyed by server, credentials and session settings.
+
+    Thread-safe. Connections are handed out most-recently-released first,
+    since those are the least likely to have timed out on the server.
+    """
+
+    def __init__(self, idle_timeout_seconds: float = IDLE_TIMEOUT_SECONDS):
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._idle: dict[PoolKey, deque[tuple[ftplib.FTP, float]]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: PoolKey) -> ftplib.FTP | None:
+        """
+        Take a live idle connection for key.
+
+        Args:
+            key: The PoolKey the connection must have been set up with.
+
+        Returns:
+            A connection that answered NOOP, or None if none is available.
+        """
+        while True:
+            with self._lock:
+                bucket = self._idle.get(key)
+                if not bucket:
+                    return None
+                ftp, released_at = bucket.pop()
+
+            if time.monotonic() - released_at > self.idle_timeout_seconds:
+                _close(ftp)
+                continue
+            try:
+                ftp.voidcmd("NOOP")
+            except Exception as e:
+                logger.debug("Discarding dead pooled connection: %s", e)
+                _close(ftp)
+                continue
+            return ftp
+
+    def release(self, key: PoolKey, ftp: ftplib.FTP, max_idle: int) -> None:
+        """
+        Return a healthy connection for reuse, or close it if the pool is full.
+
+        Args:
+            key: The PoolKey the connection was set up with.
+            ftp: The logged-in connection.
+            max_idle: Maximum idle connections to keep for this key.
+        """
+        with self._lock:
+            bucket = self._idle.setdefault(key, deque())
+            if len(bucket) < max_idle:
+                bucket.append((ftp, time.monotonic()))
+                return
+        _close(ftp)
+
+    def clear(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            buckets = list(self._idle.values())
+            self._idle.clear()
+        for bucket in buckets:
+            for ftp, _ in bucket:
+                _close(ftp)
+
+
+# Shared by every FTPClient whose ConnectionConfig enables pooling
+shared_pool = FTPPool()
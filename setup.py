@@ -8,7 +8,6 @@ setup(
     packages=find_packages(),
     install_requires=[
         "winfspy>=0.8.0",
-        "cachetools>=5.0.0",
     ],
     entry_points={
         "console_scripts": [
@@ -0,0 +1,31 @@
+"""
+Helpers shared by the FTP client tests.
+
+Plain factories rather than fixtures, for tests that need to build several
+fake server responses with different contents.
+"""
+
+from collections.abc import Callable
+from io import BytesIO
+from unittest.mock import MagicMock
+
+# FEAT reply advertising MLSD only
+FEAT_MLSD = "211-Features:\r\n MLSD\r\n211 End"
+
+
+def make_retrbinary(data: bytes) -> Callable[..., None]:
+    """Build a retrbinary side effect that delivers data in a single chunk."""
+
+    def _retrbinary(cmd, callback, **_):
+        callback(data)
+
+    return _retrbinary
+
+
+def make_data_channel(mock_ftp: MagicMock, content: bytes) -> MagicMock:
+    """Serve content over a mocked transfercmd data connection, then EOF."""
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    conn.recv.side_effect = BytesIO(content).read
+    mock_ftp.transfercmd.return_value = conn
+    return conn
@@ -3,10 +3,12 @@ Shared pytest fixtures for FTP-WinMount tests.
 """
 
 import ftplib
+import time
 from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -20,6 +22,22 @@ from ftp_winmount.config import (
 )
 from ftp_winmount.ftp_client import FileStats, FTPClient
 
+from ._common import FEAT_MLSD
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Makes FTPClient retry backoff instant.
+
+    Only the ftp_client module's view of ``time`` is replaced; its
+    ``time.time`` stays real.
+    """
+    monkeypatch.setattr(
+        "ftp_winmount.ftp_client.time",
+        SimpleNamespace(time=time.time, sleep=lambda *_: None),
+    )
+
 
 @pytest.fixture
 def tmp_config_file(tmp_path: Path) -> Generator[Path, None, None]:
@@ -36,6 +54,7 @@ username = testuser
 password = testpass
 passive_mode = true
 encoding = utf-8
+transfer_block_size = 65536
 
 [mount]
 drive_letter = Z
@@ -45,12 +64,16 @@ volume_label = Test FTP Drive
 enabled = true
 directory_ttl_seconds = 60
 metadata_ttl_seconds = 120
+negative_ttl_seconds = 10
+max_entries = 500
 
 [connection]
 timeout_seconds = 45
 retry_attempts = 5
 retry_delay_seconds = 2
 keepalive_interval_seconds = 90
+pool_size = 2
+stat_cache_ttl_seconds = 0.5
 
 [logging]
 level = DEBUG
@@ -90,19 +113,37 @@ def mock_ftp() -> Generator[MagicMock, None, None]:
         Mocked FTP object with common methods stubbed.
     """
     mock = MagicMock(spec=ftplib.FTP)
-    mock.encoding = "utf-8"
 
-    # Default responses
-    mock.sendcmd.return_value = "200 OK"
-    mock.voidcmd.return_value = None
-    mock.login.return_value = "230 Login successful"
-    mock.cwd.return_value = "250 OK"
-    mock.pwd.return_value = "/"
-    mock.quit.return_value = "221 Goodbye"
+    # Default responses, configured in one pass
+    mock.configure_mock(
+        **{
+            "encoding": "utf-8",
+            "sendcmd.return_value": "200 OK",
+            "voidcmd.return_value": None,
+            "login.return_value": "230 Login successful",
+            "cwd.return_value": "250 OK",
+            "pwd.return_value": "/",
+            "quit.return_value": "221 Goodbye",
+        }
+    )
 
     yield mock
 
 
+@pytest.fixture
+def patched_ftp(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """
+    Patches ftplib.FTP so FTPClient.connect() gets a mock that advertises MLSD.
+
+    Returns:
+        The mocked FTP instance the client will connect with.
+    """
+    mock = MagicMock(spec=ftplib.FTP)
+    mock.configure_mock(**{"sendcmd.return_value": FEAT_MLSD})
+    monkeypatch.setattr("ftp_winmount.ftp_client.ftplib.FTP", MagicMock(return_value=mock))
+    return mock
+
+
 @pytest.fixture
 def ftp_config() -> FTPConfig:
     """Creates a standard FTPConfig for testing."""
@@ -122,7 +163,7 @@ def conn_config() -> ConnectionConfig:
     return ConnectionConfig(
         timeout_seconds=30,
         retry_attempts=3,
-        retry_delay_seconds=1,
+        retry_delay_seconds=0,
         keepalive_interval_seconds=60,
     )
 
@@ -139,22 +180,25 @@ def cache_config() -> CacheConfig:
 
 @pytest.fixture
 def ftp_client(
-    ftp_config: FTPConfig, conn_config: ConnectionConfig, mock_ftp: MagicMock
-) -> Generator[FTPClient, None, None]:
+    ftp_config: FTPConfig,
+    conn_config: ConnectionConfig,
+    mock_ftp: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> FTPClient:
     """
     Creates an FTPClient with a mocked FTP connection.
 
     Returns:
         FTPClient instance with mocked underlying FTP.
     """
-    with patch("ftp_winmount.ftp_client.ftplib.FTP", return_value=mock_ftp):
-        client = FTPClient(ftp_config, conn_config)
-        client._ftp = mock_ftp
-        client._connected = True
-        client._supports_mlsd = True
-        client._supports_mlst = True
-        client._supports_rest = True
-        yield client
+    monkeypatch.setattr("ftp_winmount.ftp_client.ftplib.FTP", MagicMock(return_value=mock_ftp))
+    client = FTPClient(ftp_config, conn_config)
+    client._ftp = mock_ftp
+    client._connected = True
+    client._supports_mlsd = True
+    client._supports_mlst = True
+    client._supports_rest = True
+    return client
 
 
 @pytest.fixture
@@ -8,16 +8,20 @@ Tests cover:
 - DirectoryCache.get returns None after TTL expires
 - DirectoryCache.invalidate removes entry
 - DirectoryCache.invalidate_parent extracts parent path
+- invalidate_many drops several entries in one call
 - MetadataCache same patterns
 - Thread safety with concurrent access
 """
 
 import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from unittest.mock import patch
 
+import pytest
+
 from ftp_winmount.cache import CacheEntry, DirectoryCache, MetadataCache
 
 
@@ -37,6 +41,14 @@ class TestDirectoryCacheGet:
         assert cache.get("/folder") is None
         assert cache.get("/folder/subfolder") is None
 
+    def test_get_does_not_wait_for_writers(self):
+        """Test that a fresh hit is served while a writer holds the lock."""
+        cache = DirectoryCache(ttl_seconds=30)
+        cache.put("/folder", [{"file_name": "a.txt"}])
+
+        with cache._lock:
+            assert cache.get("/folder") == [{"file_name": "a.txt"}]
+
 
 class TestDirectoryCachePut:
     """Tests for DirectoryCache.put method."""
@@ -94,23 +106,27 @@ class TestDirectoryCacheTTL:
         cache = DirectoryCache(ttl_seconds=1)
         test_listing = [{"name": "file.txt"}]
 
-        cache.put("/path", test_listing)
+        with patch("ftp_winmount.cache.time.time") as mock_time:
+            mock_time.return_value = 100.0
+            cache.put("/path", test_listing)
 
-        # Wait for TTL to expire
-        time.sleep(1.1)
+            # Step past the TTL
+            mock_time.return_value = 101.1
+            result = cache.get("/path")
 
-        result = cache.get("/path")
         assert result is None
 
     def test_ttl_expiration_removes_entry(self):
         """Test that expired entry is removed from internal cache."""
         cache = DirectoryCache(ttl_seconds=1)
-        cache.put("/path", [{"name": "file.txt"}])
 
-        time.sleep(1.1)
+        with patch("ftp_winmount.cache.time.time") as mock_time:
+            mock_time.return_value = 100.0
+            cache.put("/path", [{"name": "file.txt"}])
 
-        # Access triggers removal
-        cache.get("/path")
+            # Access triggers removal
+            mock_time.return_value = 101.1
+            cache.get("/path")
 
         # Verify it's actually removed
         assert "/path" not in cache._cache
@@ -119,13 +135,15 @@ class TestDirectoryCacheTTL:
         """Test that expired entry can be replaced with new data."""
         cache = DirectoryCache(ttl_seconds=1)
 
-        cache.put("/path", [{"name": "old"}])
-        time.sleep(1.1)
+        with patch("ftp_winmount.cache.time.time") as mock_time:
+            mock_time.return_value = 100.0
+            cache.put("/path", [{"name": "old"}])
 
-        # Old entry expired, put new data
-        cache.put("/path", [{"name": "new"}])
+            # Old entry expired, put new data
+            mock_time.return_value = 101.1
+            cache.put("/path", [{"name": "new"}])
 
-        result = cache.get("/path")
+            result = cache.get("/path")
         assert result == [{"name": "new"}]
 
 
@@ -159,6 +177,133 @@ class TestDirectoryCacheInvalidate:
         assert cache.get("/path1") is None
         assert cache.get("/path2") == [{"name": "file2.txt"}]
 
+    def test_invalidate_many_removes_all_given_paths(self):
+        """Test that invalidate_many removes every listed path and nothing else."""
+        cache = DirectoryCache(ttl_seconds=30)
+        cache.put("/a", [{"name": "a.txt"}])
+        cache.put("/b", [{"name": "b.txt"}])
+        cache.put("/c", [{"name": "c.txt"}])
+
+        cache.invalidate_many(("/a", "/b", "/missing"))
+
+        assert cache.get("/a") is None
+        assert cache.get("/b") is None
+        assert cache.get("/c") == [{"name": "c.txt"}]
+
+
+class TestCacheInvalidateTree:
+    """Tests for subtree invalidation through the parent -> children index."""
+
+    @pytest.mark.parametrize("cache_cls", [DirectoryCache, MetadataCache])
+    def test_invalidate_tree_removes_subtree_only(self, cache_cls):
+        """Test that a path and all descendants go, siblings and ancestors stay."""
+        cache = cache_cls(ttl_seconds=30)
+        for path in ("/a", "/a/b", "/a/b/c.txt", "/a/bc", "/x"):
+            cache.put(path, path)
+
+        cache.invalidate_tree("/a/b")
+
+        assert cache.get("/a/b") is None
+        assert cache.get("/a/b/c.txt") is None
+        assert cache.get("/a") == "/a"
+        assert cache.get("/a/bc") == "/a/bc"
+        assert cache.get("/x") == "/x"
+
+    def test_invalidate_tree_reaches_through_uncached_directories(self):
+        """Test that descendants are found even when intermediate dirs are not cached."""
+        cache = MetadataCache(ttl_seconds=30)
+        cache.put("/a/b/c/deep.txt", {"size": 1})
+
+        cache.invalidate_tree("/a")
+
+        assert cache.get("/a/b/c/deep.txt") is None
+        assert cache._children == {}
+
+    def test_index_pruned_as_entries_leave(self):
+        """Test that invalidating the last entry of a branch removes the branch."""
+        cache = DirectoryCache(ttl_seconds=30)
+        cache.put("/a/b/one", [])
+        cache.put("/a/b/two", [])
+        cache.put("/a", [])
+
+        cache.invalidate_many(["/a/b/one", "/a/b/two"])
+
+        assert cache._children == {"/": {"/a"}}
+
+    def test_clear_empties_cache_and_index(self):
+        """Test that clear drops entries and the index."""
+        cache = DirectoryCache(ttl_seconds=30)
+        cache.put("/a/b", [])
+
+        cache.clear()
+
+        assert cache._cache == {}
+        assert cache._children == {}
+
+
+class TestCacheMaxEntries:
+    """Tests for the max_entries bound."""
+
+    @pytest.mark.parametrize("cache_cls", [DirectoryCache, MetadataCache])
+    def test_oldest_entry_evicted_at_capacity(self, cache_cls):
+        """Test that inserting past max_entries drops the least recently used entry."""
+        cache = cache_cls(ttl_seconds=30, max_entries=2)
+        cache.put("/a", 1)
+        cache.put("/b", 2)
+
+        cache.put("/c", 3)
+
+        assert cache.get("/a") is None
+        assert cache.get("/b") == 2
+        assert cache.get("/c") == 3
+        assert len(cache._cache) == 2
+
+    def test_replacing_entry_does_not_evict(self):
+        """Test that updating an existing path at capacity keeps every entry."""
+        cache = MetadataCache(ttl_seconds=30, max_entries=2)
+        cache.put("/a", 1)
+        cache.put("/b", 2)
+
+        cache.put("/a", 10)
+
+        assert cache.get("/a") == 10
+        assert cache.get("/b") == 2
+
+    @pytest.mark.parametrize("cache_cls", [DirectoryCache, MetadataCache])
+    def test_hit_protects_entry_from_eviction(self, cache_cls):
+        """Test that a recently read entry outlives newer but unread ones."""
+        cache = cache_cls(ttl_seconds=30, max_entries=2)
+        cache.put("/", 1)
+        cache.put("/b", 2)
+
+        cache.get("/")
+        cache.put("/c", 3)
+
+        assert cache.get("/") == 1
+        assert cache.get("/b") is None
+        assert cache.get("/c") == 3
+
+    def test_replacing_entry_marks_it_recent(self):
+        """Test that re-putting a path moves it to the recently used end."""
+        cache = DirectoryCache(ttl_seconds=30, max_entries=2)
+        cache.put("/a", 1)
+        cache.put("/b", 2)
+
+        cache.put("/a", 10)
+        cache.put("/c", 3)
+
+        assert cache.get("/a") == 10
+        assert cache.get("/b") is None
+
+    def test_eviction_prunes_index(self):
+        """Test that an evicted entry's branch leaves the parent index."""
+        cache = DirectoryCache(ttl_seconds=30, max_entries=1)
+        cache.put("/old/dir", [])
+
+        cache.put("/new", [])
+
+        assert cache._children == {"/": {"/new"}}
+
 
 class TestDirectoryCacheInvalidateParent:
     """Tests for DirectoryCache.invalidate_parent method."""
@@ -266,6 +411,19 @@ class TestMetadataCachePut:
         assert cache.get("/file1.txt") == meta1
         assert cache.get("/file2.txt") == meta2
 
+    def test_put_with_ttl_override(self):
+        """Test that a per-entry TTL overrides the cache default."""
+        cache = MetadataCache(ttl_seconds=60)
+
+        with patch("ftp_winmount.cache.time.time") as mock_time:
+            mock_time.return_value = 100.0
+            cache.put("/short.txt", {"size": 1}, ttl_seconds=5)
+            cache.put("/long.txt", {"size": 2})
+
+            mock_time.return_value = 106.0
+            assert cache.get("/short.txt") is None
+            assert cache.get("/long.txt") == {"size": 2}
+
 
 class TestMetadataCacheTTL:
     """Tests for MetadataCache TTL expiration."""
@@ -285,25 +443,55 @@ class TestMetadataCacheTTL:
         cache = MetadataCache(ttl_seconds=1)
         test_metadata = {"size": 1024}
 
-        cache.put("/file.txt", test_metadata)
+        with patch("ftp_winmount.cache.time.time") as mock_time:
+            mock_time.return_value = 100.0
+            cache.put("/file.txt", test_metadata)
 
-        time.sleep(1.1)
+            mock_time.return_value = 101.1
+            result = cache.get("/file.txt")
 
-        result = cache.get("/file.txt")
         assert result is None
 
     def test_ttl_expiration_removes_entry(self):
         """Test that expired entry is removed from internal cache."""
         cache = MetadataCache(ttl_seconds=1)
-        cache.put("/file.txt", {"size": 1024})
 
-        time.sleep(1.1)
+        with patch("ftp_winmount.cache.time.time") as mock_time:
+            mock_time.return_value = 100.0
+            cache.put("/file.txt", {"size": 1024})
 
-        # Access triggers removal
-        cache.get("/file.txt")
+            # Access triggers removal
+            mock_time.return_value = 101.1
+            cache.get("/file.txt")
 
         assert "/file.txt" not in cache._cache
 
+    def test_expired_read_does_not_evict_replacement(self):
+        """Test that a reader holding an expired entry keeps a concurrent fresh put."""
+        cache = MetadataCache(ttl_seconds=10)
+
+        with patch("ftp_winmount.cache.time.time", return_value=1000.0):
+            cache.put("/file.txt", {"size": 1})
+        stale = cache._cache["/file.txt"]
+
+        class RacingDict(OrderedDict):
+            """Hands the first lookup the stale entry, as if a put raced the read."""
+
+            raced = False
+
+            def get(self, key, default=None):
+                if not self.raced:
+                    self.raced = True
+                    return stale
+                return super().get(key, default)
+
+        with patch("ftp_winmount.cache.time.time", return_value=2000.0):
+            cache.put("/file.txt", {"size": 2})
+            cache._cache = RacingDict(cache._cache)
+
+            assert cache.get("/file.txt") is None
+            assert cache.get("/file.txt") == {"size": 2}
+
 
 class TestMetadataCacheInvalidate:
     """Tests for MetadataCache.invalidate method."""
@@ -335,6 +523,19 @@ class TestMetadataCacheInvalidate:
         assert cache.get("/file1.txt") is None
         assert cache.get("/file2.txt") == {"size": 200}
 
+    def test_invalidate_many_removes_all_given_paths(self):
+        """Test that invalidate_many removes every listed path and nothing else."""
+        cache = MetadataCache(ttl_seconds=30)
+        cache.put("/file1.txt", {"size": 100})
+        cache.put("/file2.txt", {"size": 200})
+        cache.put("/file3.txt", {"size": 300})
+
+        cache.invalidate_many(["/file1.txt", "/file2.txt"])
+
+        assert cache.get("/file1.txt") is None
+        assert cache.get("/file2.txt") is None
+        assert cache.get("/file3.txt") == {"size": 300}
+
 
 class TestCacheEntry:
     """Tests for CacheEntry dataclass."""
@@ -403,6 +604,7 @@ class TestDirectoryCacheThreadSafety:
         # All threads should have gotten valid results
         assert len(results) == num_threads * 100
 
+    @pytest.mark.slow
     def test_concurrent_put_and_invalidate(self):
         """Test concurrent put and invalidate operations."""
         cache = DirectoryCache(ttl_seconds=30)
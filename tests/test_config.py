@@ -39,6 +39,7 @@ class TestLoadConfigWithINIFile:
         assert config.ftp.password == "testpass"
         assert config.ftp.passive_mode is True
         assert config.ftp.encoding == "utf-8"
+        assert config.ftp.transfer_block_size == 65536
 
         # Verify mount section
         assert config.mount.drive_letter == "Z"
@@ -48,12 +49,16 @@ class TestLoadConfigWithINIFile:
         assert config.cache.enabled is True
         assert config.cache.directory_ttl_seconds == 60
         assert config.cache.metadata_ttl_seconds == 120
+        assert config.cache.negative_ttl_seconds == 10
+        assert config.cache.max_entries == 500
 
         # Verify connection section
         assert config.connection.timeout_seconds == 45
         assert config.connection.retry_attempts == 5
         assert config.connection.retry_delay_seconds == 2
         assert config.connection.keepalive_interval_seconds == 90
+        assert config.connection.pool_size == 2
+        assert config.connection.stat_cache_ttl_seconds == 0.5
 
         # Verify logging section
         assert config.logging.level == "DEBUG"
@@ -86,8 +91,11 @@ class TestLoadConfigWithINIFile:
         assert config.ftp.passive_mode is True
         assert config.cache.enabled is True
         assert config.cache.directory_ttl_seconds == 30
+        assert config.cache.negative_ttl_seconds == 5
+        assert config.cache.max_entries == 10000
         assert config.connection.timeout_seconds == 30
         assert config.connection.retry_attempts == 3
+        assert config.connection.stat_cache_ttl_seconds == 0
         assert config.logging.level == "INFO"
         assert config.logging.console is True
 
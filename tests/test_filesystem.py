@@ -14,7 +14,6 @@ Tests cover:
 """
 
 from datetime import datetime
-from io import BytesIO
 from unittest.mock import MagicMock
 
 import pytest
@@ -55,12 +54,19 @@ def FileContext(
     )
     # Allow setting buffer/dirty after creation via kwargs
     if "buffer" in kwargs:
-        ctx.buffer = kwargs["buffer"]
+        buffer = kwargs["buffer"]
+        ctx.buffer = bytearray(buffer) if isinstance(buffer, bytes) else buffer
     if "dirty" in kwargs:
         ctx.dirty = kwargs["dirty"]
     return ctx
 
 
+# Shared listing/stat results; no test depends on the mtime being current
+_FIXED_MTIME = datetime(2024, 1, 15)
+_FILE_STATS = FileStats(name="file.txt", size=1024, mtime=_FIXED_MTIME, is_dir=False)
+_DIR_STATS = FileStats(name="folder", size=0, mtime=_FIXED_MTIME, is_dir=True)
+
+
 @pytest.fixture
 def filesystem(mock_ftp_client: MagicMock, cache_config: CacheConfig) -> FTPFileSystem:
     """Create FTPFileSystem with mocked FTPClient."""
@@ -100,6 +106,11 @@ class TestPathConversion:
         result = filesystem._to_ftp_path("folder/file.txt")
         assert result == "/folder/file.txt"
 
+    def test_posix_path_returned_unchanged(self, filesystem: FTPFileSystem):
+        """Test already-normalized FTP path is returned as-is."""
+        path = "/folder/file.txt"
+        assert filesystem._to_ftp_path(path) is path
+
 
 class TestGetSecurityByName:
     """Tests for get_security_by_name method."""
@@ -108,12 +119,7 @@ class TestGetSecurityByName:
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
     ):
         """Test that file attributes are returned for files."""
-        mock_ftp_client.get_file_info.return_value = FileStats(
-            name="file.txt",
-            size=1024,
-            mtime=datetime.now(),
-            is_dir=False,
-        )
+        mock_ftp_client.get_file_info.return_value = _FILE_STATS
 
         attrs, security, size = filesystem.get_security_by_name("\\file.txt")
 
@@ -125,12 +131,7 @@ class TestGetSecurityByName:
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
     ):
         """Test that directory attributes are returned for directories."""
-        mock_ftp_client.get_file_info.return_value = FileStats(
-            name="folder",
-            size=0,
-            mtime=datetime.now(),
-            is_dir=True,
-        )
+        mock_ftp_client.get_file_info.return_value = _DIR_STATS
 
         attrs, security, size = filesystem.get_security_by_name("\\folder")
 
@@ -158,12 +159,7 @@ class TestGetSecurityByName:
 
     def test_uses_metadata_cache(self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock):
         """Test that metadata cache is used for subsequent calls."""
-        mock_ftp_client.get_file_info.return_value = FileStats(
-            name="file.txt",
-            size=1024,
-            mtime=datetime.now(),
-            is_dir=False,
-        )
+        mock_ftp_client.get_file_info.return_value = _FILE_STATS
 
         # First call - should hit FTP
         filesystem.get_security_by_name("\\file.txt")
@@ -178,30 +174,45 @@ class TestGetSecurityByName:
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
     ):
         """Test that security descriptor handle is returned."""
-        mock_ftp_client.get_file_info.return_value = FileStats(
-            name="file.txt",
-            size=1024,
-            mtime=datetime.now(),
-            is_dir=False,
-        )
+        mock_ftp_client.get_file_info.return_value = _FILE_STATS
 
         attrs, security, size = filesystem.get_security_by_name("\\file.txt")
 
         # Security descriptor handle is returned (not None)
         assert security is not None
 
+    def test_caches_not_found_result(self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock):
+        """Test that repeated lookups of a missing path only hit FTP once."""
+        mock_ftp_client.get_file_info.side_effect = FileNotFoundError("Not found")
+
+        with pytest.raises(NTStatusObjectNameNotFound):
+            filesystem.get_security_by_name("\\desktop.ini")
+        with pytest.raises(NTStatusObjectNameNotFound):
+            filesystem.get_security_by_name("\\desktop.ini")
+        with pytest.raises(NTStatusObjectNameNotFound):
+            filesystem.open("\\desktop.ini", 0, 0)
+
+        assert mock_ftp_client.get_file_info.call_count == 1
+
+    def test_create_clears_cached_not_found(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that creating a file clears its cached not-found result."""
+        mock_ftp_client.get_file_info.side_effect = FileNotFoundError("Not found")
+        with pytest.raises(NTStatusObjectNameNotFound):
+            filesystem.get_security_by_name("\\newfile.txt")
+
+        filesystem.create("\\newfile.txt", 0, 0, FILE_ATTRIBUTE_NORMAL, None, 0)
+
+        assert filesystem.meta_cache.get("/newfile.txt") is None
+
 
 class TestOpen:
     """Tests for open method."""
 
     def test_open_creates_file_context(self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock):
         """Test that open creates a FileContext."""
-        mock_ftp_client.get_file_info.return_value = FileStats(
-            name="file.txt",
-            size=1024,
-            mtime=datetime(2024, 1, 15),
-            is_dir=False,
-        )
+        mock_ftp_client.get_file_info.return_value = _FILE_STATS
 
         context = filesystem.open("\\file.txt", 0, 0)
 
@@ -214,12 +225,7 @@ class TestOpen:
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
     ):
         """Test that open creates a directory FileContext."""
-        mock_ftp_client.get_file_info.return_value = FileStats(
-            name="folder",
-            size=0,
-            mtime=datetime(2024, 1, 15),
-            is_dir=True,
-        )
+        mock_ftp_client.get_file_info.return_value = _DIR_STATS
 
         context = filesystem.open("\\folder", 0, 0)
 
@@ -237,12 +243,7 @@ class TestOpen:
 
     def test_open_uses_metadata_cache(self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock):
         """Test that open uses metadata cache."""
-        mock_ftp_client.get_file_info.return_value = FileStats(
-            name="file.txt",
-            size=1024,
-            mtime=datetime.now(),
-            is_dir=False,
-        )
+        mock_ftp_client.get_file_info.return_value = _FILE_STATS
 
         # First open - populates cache
         filesystem.open("\\file.txt", 0, 0)
@@ -278,12 +279,51 @@ class TestRead:
         """Test read with offset."""
         mock_ftp_client.read_file.return_value = b"content"
 
-        context = FileContext(path="/file.txt", is_directory=False, file_size=20)
+        context = FileContext(path="/file.txt", is_directory=False, file_size=12)
 
         filesystem.read(context, 5, 7)
 
         mock_ftp_client.read_file.assert_called_once_with("/file.txt", 5, 7)
 
+    def test_read_fetches_ahead_and_serves_sequential_reads(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that a read fetches a larger window and later reads hit it."""
+        content = bytes(range(256)) * 4
+        mock_ftp_client.read_file.return_value = content
+
+        context = FileContext(path="/file.txt", is_directory=False, file_size=len(content))
+
+        assert filesystem.read(context, 0, 100) == content[:100]
+        assert filesystem.read(context, 100, 100) == content[100:200]
+        assert filesystem.read(context, 900, 200) == content[900:]
+
+        # Window is capped at EOF rather than READ_AHEAD_SIZE
+        mock_ftp_client.read_file.assert_called_once_with("/file.txt", 0, len(content))
+
+    def test_read_outside_window_refetches(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that a read before the cached window goes back to the server."""
+        mock_ftp_client.read_file.side_effect = [b"b" * 10, b"a" * 20]
+
+        context = FileContext(path="/file.txt", is_directory=False, file_size=20)
+
+        assert filesystem.read(context, 10, 5) == b"bbbbb"
+        assert filesystem.read(context, 0, 5) == b"aaaaa"
+        assert mock_ftp_client.read_file.call_count == 2
+
+    def test_read_serves_unflushed_writes(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that reads see data written through the same handle."""
+        context = FileContext(
+            path="/file.txt", is_directory=False, file_size=11, buffer=b"hello world"
+        )
+
+        assert filesystem.read(context, 6, 5) == b"world"
+        mock_ftp_client.read_file.assert_not_called()
+
     def test_read_beyond_eof_returns_empty(
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
     ):
@@ -308,6 +348,15 @@ class TestRead:
         # Should adjust to actual remaining bytes
         mock_ftp_client.read_file.assert_called_once_with("/file.txt", 7, 3)
 
+    def test_read_zero_length_skips_ftp(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that a zero-length read returns empty bytes without a transfer."""
+        context = FileContext(path="/file.txt", is_directory=False, file_size=10)
+
+        assert filesystem.read(context, 0, 0) == b""
+        mock_ftp_client.read_file.assert_not_called()
+
 
 class TestReadDirectory:
     """Tests for read_directory method."""
@@ -337,14 +386,28 @@ class TestReadDirectory:
         # list_dir should only be called once
         assert mock_ftp_client.list_dir.call_count == 1
 
+    def test_read_directory_warms_metadata_cache(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that child lookups after a listing are served from cache."""
+        context = FileContext(path="/folder", is_directory=True, file_size=0)
+
+        filesystem.read_directory(context, None)
+        attrs, _, _ = filesystem.get_security_by_name("\\folder\\file1.txt")
+        child = filesystem.open("\\folder\\folder1", 0, 0)
+
+        assert attrs == FILE_ATTRIBUTE_NORMAL
+        assert child.is_directory is True
+        mock_ftp_client.get_file_info.assert_not_called()
+
     def test_read_directory_with_marker_pagination(
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
     ):
         """Test read_directory with marker for pagination."""
         mock_ftp_client.list_dir.return_value = [
-            FileStats(name="a.txt", size=100, mtime=datetime.now(), is_dir=False),
-            FileStats(name="b.txt", size=200, mtime=datetime.now(), is_dir=False),
-            FileStats(name="c.txt", size=300, mtime=datetime.now(), is_dir=False),
+            FileStats(name="a.txt", size=100, mtime=_FIXED_MTIME, is_dir=False),
+            FileStats(name="b.txt", size=200, mtime=_FIXED_MTIME, is_dir=False),
+            FileStats(name="c.txt", size=300, mtime=_FIXED_MTIME, is_dir=False),
         ]
 
         context = FileContext(path="/folder", is_directory=True, file_size=0)
@@ -357,6 +420,22 @@ class TestReadDirectory:
         assert result[0]["file_name"] == "b.txt"
         assert result[1]["file_name"] == "c.txt"
 
+    def test_read_directory_marker_pagination_sorts_and_skips_missing_marker(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that unsorted listings are paged by name even if the marker is gone."""
+        mock_ftp_client.list_dir.return_value = [
+            FileStats(name="c.txt", size=300, mtime=_FIXED_MTIME, is_dir=False),
+            FileStats(name="a.txt", size=100, mtime=_FIXED_MTIME, is_dir=False),
+            FileStats(name="d.txt", size=400, mtime=_FIXED_MTIME, is_dir=False),
+        ]
+
+        context = FileContext(path="/folder", is_directory=True, file_size=0)
+
+        result = filesystem.read_directory(context, "b.txt")
+
+        assert [e["file_name"] for e in result] == ["c.txt", "d.txt"]
+
     def test_read_directory_entry_format(
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
     ):
@@ -406,7 +485,7 @@ class TestCreate:
         context = filesystem.create("\\newfile.txt", 0, 0, FILE_ATTRIBUTE_NORMAL, None, 0)
 
         assert context.buffer is not None
-        assert isinstance(context.buffer, BytesIO)
+        assert isinstance(context.buffer, bytearray)
 
     def test_create_directory_returns_context_without_buffer(
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
@@ -423,7 +502,7 @@ class TestCreate:
     ):
         """Test that create invalidates parent directory cache."""
         # Pre-populate cache
-        filesystem.dir_cache.put("/parent", [{"name": "existing"}])
+        filesystem.dir_cache.put("/parent", [{"file_name": "existing"}])
 
         filesystem.create("\\parent\\newfile.txt", 0, 0, FILE_ATTRIBUTE_NORMAL, None, 0)
 
@@ -456,8 +535,7 @@ class TestWrite:
 
         # Data should be buffered
         assert context.buffer is not None
-        context.buffer.seek(0)
-        assert context.buffer.read() == b"test data"
+        assert bytes(context.buffer) == b"test data"
 
         # FTP write should NOT be called yet
         mock_ftp_client.write_file.assert_not_called()
@@ -494,15 +572,30 @@ class TestWrite:
             path="/file.txt",
             is_directory=False,
             file_size=11,  # "hello world" is 11 chars
-            buffer=BytesIO(b"hello world"),
+            buffer=bytearray(b"hello world"),
         )
 
         filesystem.write(context, b"TEST", 6)
 
-        context.buffer.seek(0)
         # "hello world" with "TEST" written at offset 6 overwrites positions 6-9
         # Position 10 is 'd', which remains
-        assert context.buffer.read() == b"hello TESTd"
+        assert bytes(context.buffer) == b"hello TESTd"
+
+    def test_write_past_end_zero_fills_gap(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that writing beyond the buffer end pads the gap with zeros."""
+        context = FileContext(
+            path="/file.txt",
+            is_directory=False,
+            file_size=2,
+            buffer=b"ab",
+        )
+
+        filesystem.write(context, b"cd", 4)
+
+        assert bytes(context.buffer) == b"ab\x00\x00cd"
+        assert context.file_size == 6
 
     def test_write_existing_file_reads_content_first(
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
@@ -522,6 +615,18 @@ class TestWrite:
         # Should have read existing content
         mock_ftp_client.read_file.assert_called_once()
 
+    def test_write_full_overwrite_skips_read(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that a write replacing the whole file does not download it first."""
+        context = FileContext(path="/file.txt", is_directory=False, file_size=5, buffer=None)
+
+        filesystem.write(context, b"brand new", 0)
+
+        mock_ftp_client.read_file.assert_not_called()
+        assert bytes(context.buffer) == b"brand new"
+        assert context.file_size == 9
+
 
 class TestFlush:
     """Tests for flush method."""
@@ -532,7 +637,7 @@ class TestFlush:
             path="/file.txt",
             is_directory=False,
             file_size=9,
-            buffer=BytesIO(b"test data"),
+            buffer=bytearray(b"test data"),
             dirty=True,
         )
 
@@ -546,7 +651,7 @@ class TestFlush:
             path="/file.txt",
             is_directory=False,
             file_size=9,
-            buffer=BytesIO(b"test data"),
+            buffer=bytearray(b"test data"),
             dirty=True,
         )
 
@@ -562,7 +667,7 @@ class TestFlush:
             path="/file.txt",
             is_directory=False,
             file_size=9,
-            buffer=BytesIO(b"test data"),
+            buffer=bytearray(b"test data"),
             dirty=False,
         )
 
@@ -597,7 +702,7 @@ class TestFlush:
             path="/file.txt",
             is_directory=False,
             file_size=9,
-            buffer=BytesIO(b"test data"),
+            buffer=bytearray(b"test data"),
             dirty=True,
         )
 
@@ -659,7 +764,7 @@ class TestCleanup:
         """Test that cleanup invalidates caches."""
         # Pre-populate caches
         filesystem.meta_cache.put("/file.txt", {"size": 100})
-        filesystem.dir_cache.put("/", [{"name": "file.txt"}])
+        filesystem.dir_cache.put("/", [{"file_name": "file.txt"}])
 
         context = FileContext(
             path="/file.txt",
@@ -739,7 +844,7 @@ class TestRename:
         # Pre-populate caches
         filesystem.meta_cache.put("/old.txt", {"size": 100})
         filesystem.meta_cache.put("/new.txt", {"size": 200})
-        filesystem.dir_cache.put("/", [{"name": "old.txt"}])
+        filesystem.dir_cache.put("/", [{"file_name": "old.txt"}])
 
         context = FileContext(path="/old.txt", is_directory=False, file_size=100)
 
@@ -749,6 +854,38 @@ class TestRename:
         assert filesystem.meta_cache.get("/new.txt") is None
         assert filesystem.dir_cache.get("/") is None
 
+    def test_rename_directory_invalidates_old_listing(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that renaming a directory drops its own cached listing."""
+        mock_ftp_client.get_file_info.side_effect = FileNotFoundError()
+        filesystem.dir_cache.put("/olddir", [{"file_name": "inner.txt"}])
+        filesystem.dir_cache.put("/other", [{"file_name": "keep.txt"}])
+
+        context = FileContext(path="/olddir", is_directory=True)
+
+        filesystem.rename(context, "\\olddir", "\\newdir", False)
+
+        assert filesystem.dir_cache.get("/olddir") is None
+        assert filesystem.dir_cache.get("/other") == [{"file_name": "keep.txt"}]
+
+    def test_rename_directory_invalidates_cached_descendants(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that renaming a directory drops cached entries beneath it."""
+        mock_ftp_client.get_file_info.side_effect = FileNotFoundError()
+        filesystem.meta_cache.put("/olddir/sub/file.txt", {"size": 1})
+        filesystem.dir_cache.put("/olddir/sub", [{"file_name": "file.txt"}])
+        filesystem.meta_cache.put("/olddirx.txt", {"size": 2})
+
+        context = FileContext(path="/olddir", is_directory=True)
+
+        filesystem.rename(context, "\\olddir", "\\newdir", False)
+
+        assert filesystem.meta_cache.get("/olddir/sub/file.txt") is None
+        assert filesystem.dir_cache.get("/olddir/sub") is None
+        assert filesystem.meta_cache.get("/olddirx.txt") == {"size": 2}
+
     def test_rename_replace_if_exists_deletes_destination(
         self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
     ):
@@ -756,7 +893,7 @@ class TestRename:
         mock_ftp_client.get_file_info.return_value = FileStats(
             name="new.txt",
             size=100,
-            mtime=datetime.now(),
+            mtime=_FIXED_MTIME,
             is_dir=False,
         )
 
@@ -774,7 +911,7 @@ class TestRename:
         mock_ftp_client.get_file_info.return_value = FileStats(
             name="new.txt",
             size=100,
-            mtime=datetime.now(),
+            mtime=_FIXED_MTIME,
             is_dir=False,
         )
 
@@ -793,7 +930,7 @@ class TestClose:
             path="/file.txt",
             is_directory=False,
             file_size=9,
-            buffer=BytesIO(b"test data"),
+            buffer=bytearray(b"test data"),
             dirty=True,
         )
 
@@ -810,7 +947,7 @@ class TestClose:
             path="/file.txt",
             is_directory=False,
             file_size=9,
-            buffer=BytesIO(b"test data"),
+            buffer=bytearray(b"test data"),
             dirty=True,
         )
 
@@ -843,6 +980,19 @@ class TestGetFileInfo:
         assert result["last_write_time"] == mtime_filetime
         assert result["file_attributes"] == FILE_ATTRIBUTE_NORMAL
 
+    def test_get_file_info_reflects_size_after_write(
+        self, filesystem: FTPFileSystem, mock_ftp_client: MagicMock
+    ):
+        """Test that each call reports the size as of that call."""
+        context = FileContext(path="/file.txt", is_directory=False, buffer=b"")
+        before = dict(filesystem.get_file_info(context))
+
+        filesystem.write(context, b"hello", 0)
+        after = dict(filesystem.get_file_info(context))
+
+        assert (before["file_size"], before["allocation_size"]) == (0, 0)
+        assert (after["file_size"], after["allocation_size"]) == (5, 5)
+
 
 class TestSetFileInfo:
     """Tests for set_file_info method."""
@@ -855,7 +1005,7 @@ class TestSetFileInfo:
             path="/file.txt",
             is_directory=False,
             file_size=1024,
-            buffer=BytesIO(b"existing content"),
+            buffer=bytearray(b"existing content"),
             dirty=False,
         )
 
@@ -863,8 +1013,7 @@ class TestSetFileInfo:
 
         assert context.file_size == 0
         assert context.dirty is True
-        context.buffer.seek(0)
-        assert context.buffer.read() == b""
+        assert bytes(context.buffer) == b""
 
 
 class TestFileContext:
@@ -889,7 +1038,7 @@ class TestFileContext:
 
     def test_file_context_with_all_values(self):
         """Test FileContext with all values specified."""
-        buffer = BytesIO()
+        buffer = bytearray()
         mtime_filetime = 133500000000000000
 
         context = FileContext(
@@ -4,8 +4,7 @@ Unit tests for ftp_winmount.ftp_client module.
 Tests cover:
 - Connect with anonymous auth
 - Connect with credentials
-- List_dir parsing (MLSD format)
-- List_dir parsing (LIST format fallback)
+- List_dir glue for MLSD and LIST (parsing itself is in test_listing.py)
 - Read_file returns bytes
 - Write_file calls STOR
 - Error translation (550 -> FileNotFoundError)
@@ -13,19 +12,21 @@ Tests cover:
 """
 
 import ftplib
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 import pytest
 
 from ftp_winmount.config import ConnectionConfig, FTPConfig
-from ftp_winmount.ftp_client import FileStats, FTPClient
+from ftp_winmount.ftp_client import _MISSING, FileStats, FTPClient, _parse_feat
+
+from ._common import FEAT_MLSD, make_data_channel, make_retrbinary
 
 
 class TestFTPClientConnect:
     """Tests for FTPClient.connect method."""
 
-    def test_connect_with_anonymous_auth(self):
+    def test_connect_with_anonymous_auth(self, patched_ftp: MagicMock):
         """Test connecting with anonymous authentication (no username)."""
         ftp_config = FTPConfig(
             host="test.server.com",
@@ -35,25 +36,20 @@ class TestFTPClientConnect:
         )
         conn_config = ConnectionConfig()
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.sendcmd.return_value = "211-Features:\r\n MLSD\r\n211 End"
-
-            client = FTPClient(ftp_config, conn_config)
-            client.connect()
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            # Verify connection was made
-            mock_ftp.connect.assert_called_once_with(
-                host="test.server.com",
-                port=21,
-                timeout=30,
-            )
+        # Verify connection was made
+        patched_ftp.connect.assert_called_once_with(
+            host="test.server.com",
+            port=21,
+            timeout=30,
+        )
 
-            # Verify anonymous login (no args to login)
-            mock_ftp.login.assert_called_once_with()
+        # Verify anonymous login (no args to login)
+        patched_ftp.login.assert_called_once_with()
 
-    def test_connect_with_credentials(self):
+    def test_connect_with_credentials(self, patched_ftp: MagicMock):
         """Test connecting with username and password."""
         ftp_config = FTPConfig(
             host="test.server.com",
@@ -63,95 +59,114 @@ class TestFTPClientConnect:
         )
         conn_config = ConnectionConfig()
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.sendcmd.return_value = "211-Features:\r\n MLSD\r\n211 End"
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            client = FTPClient(ftp_config, conn_config)
-            client.connect()
-
-            mock_ftp.login.assert_called_once_with(
-                user="myuser",
-                passwd="mypass",
-            )
+        patched_ftp.login.assert_called_once_with(
+            user="myuser",
+            passwd="mypass",
+        )
 
-    def test_connect_sets_passive_mode(self):
+    def test_connect_sets_passive_mode(self, patched_ftp: MagicMock):
         """Test that passive mode is set according to config."""
         ftp_config = FTPConfig(host="test.server.com", passive_mode=True)
         conn_config = ConnectionConfig()
+        patched_ftp.sendcmd.return_value = "200 OK"
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.sendcmd.return_value = "200 OK"
-
-            client = FTPClient(ftp_config, conn_config)
-            client.connect()
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            mock_ftp.set_pasv.assert_called_once_with(True)
+        patched_ftp.set_pasv.assert_called_once_with(True)
 
-    def test_connect_sets_encoding(self):
+    def test_connect_sets_encoding(self, patched_ftp: MagicMock):
         """Test that encoding is set on FTP object."""
         ftp_config = FTPConfig(host="test.server.com", encoding="utf-8")
         conn_config = ConnectionConfig()
+        patched_ftp.sendcmd.return_value = "200 OK"
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.sendcmd.return_value = "200 OK"
-
-            client = FTPClient(ftp_config, conn_config)
-            client.connect()
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            assert mock_ftp.encoding == "utf-8"
+        assert patched_ftp.encoding == "utf-8"
 
-    def test_connect_login_failure_raises_permission_error(self):
+    def test_connect_login_failure_raises_permission_error(self, patched_ftp: MagicMock):
         """Test that login failure raises PermissionError."""
         ftp_config = FTPConfig(host="test.server.com", username="bad", password="creds")
         conn_config = ConnectionConfig()
+        patched_ftp.login.side_effect = ftplib.error_perm("530 Login incorrect")
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.login.side_effect = ftplib.error_perm("530 Login incorrect")
+        client = FTPClient(ftp_config, conn_config)
 
-            client = FTPClient(ftp_config, conn_config)
-
-            with pytest.raises(PermissionError) as exc_info:
-                client.connect()
+        with pytest.raises(PermissionError) as exc_info:
+            client.connect()
 
-            assert "530" in str(exc_info.value) or "Login" in str(exc_info.value)
+        assert "530" in str(exc_info.value) or "Login" in str(exc_info.value)
 
-    def test_connect_timeout_raises_timeout_error(self):
+    def test_connect_timeout_raises_timeout_error(self, patched_ftp: MagicMock):
         """Test that connection timeout raises TimeoutError."""
         ftp_config = FTPConfig(host="test.server.com")
         conn_config = ConnectionConfig(timeout_seconds=5)
+        patched_ftp.connect.side_effect = TimeoutError("Connection timed out")
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.connect.side_effect = TimeoutError("Connection timed out")
+        client = FTPClient(ftp_config, conn_config)
 
-            client = FTPClient(ftp_config, conn_config)
-
-            with pytest.raises(TimeoutError):
-                client.connect()
+        with pytest.raises(TimeoutError):
+            client.connect()
 
-    def test_connect_network_error_raises_connection_error(self):
+    def test_connect_network_error_raises_connection_error(self, patched_ftp: MagicMock):
         """Test that network error raises ConnectionError."""
         ftp_config = FTPConfig(host="test.server.com")
         conn_config = ConnectionConfig()
+        patched_ftp.connect.side_effect = OSError("Network unreachable")
+
+        client = FTPClient(ftp_config, conn_config)
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.connect.side_effect = OSError("Network unreachable")
+        with pytest.raises(ConnectionError):
+            client.connect()
 
-            client = FTPClient(ftp_config, conn_config)
+    def test_connect_reads_capabilities_from_feat(self, patched_ftp: MagicMock):
+        """Test that FEAT features set the MLSD/MLST/REST flags."""
+        patched_ftp.sendcmd.return_value = (
+            "211-Features:\r\n MLST type*;size*;modify*;\r\n REST STREAM\r\n SIZE\r\n211 End"
+        )
 
-            with pytest.raises(ConnectionError):
-                client.connect()
+        client = FTPClient(FTPConfig(host="test.server.com"), ConnectionConfig())
+        client.connect()
+
+        assert client._supports_mlsd is False
+        assert client._supports_mlst is True
+        assert client._supports_rest is True
+
+    def test_reconnect_reuses_probed_capabilities(self, patched_ftp: MagicMock):
+        """Test that FEAT is only sent on the first successful connect."""
+        client = FTPClient(FTPConfig(host="test.server.com"), ConnectionConfig())
+        client.connect()
+        client.disconnect()
+        client.connect()
+
+        feat_calls = [c for c in patched_ftp.sendcmd.call_args_list if c.args == ("FEAT",)]
+        assert len(feat_calls) == 1
+        assert client._supports_mlsd is True
+
+
+class TestParseFeat:
+    """Tests for the FEAT reply parser."""
+
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            (FEAT_MLSD, {"MLSD"}),
+            (
+                "211-Extensions supported:\n MLST type*;size*;\n rest stream\n UTF8\n211 END",
+                {"MLST", "REST", "UTF8"},
+            ),
+            ("211 No features", set()),
+            ("211-Features:\r\n\r\n211 End", set()),
+        ],
+    )
+    def test_parse_feat(self, response, expected):
+        """Test that each feature line contributes its upper-cased name."""
+        assert _parse_feat(response) == frozenset(expected)
 
 
 class TestFTPClientDisconnect:
@@ -191,19 +206,6 @@ class TestFTPClientListDirMLSD:
         assert result[0].is_dir is False
         assert result[0].mtime == datetime(2024, 1, 15, 10, 30, 0)
 
-    def test_list_dir_mlsd_parses_directories(self, ftp_client: FTPClient, mock_ftp: MagicMock):
-        """Test MLSD parsing for directories."""
-        mock_ftp.mlsd.return_value = [
-            ("folder", {"type": "dir", "size": "0", "modify": "20240115103000"}),
-        ]
-
-        result = ftp_client.list_dir("/test")
-
-        assert len(result) == 1
-        assert result[0].name == "folder"
-        assert result[0].is_dir is True
-        assert result[0].size == 0
-
     def test_list_dir_mlsd_skips_dot_entries(self, ftp_client: FTPClient, mock_ftp: MagicMock):
         """Test that . and .. entries are skipped."""
         mock_ftp.mlsd.return_value = [
@@ -217,18 +219,6 @@ class TestFTPClientListDirMLSD:
         assert len(result) == 1
         assert result[0].name == "file.txt"
 
-    def test_list_dir_mlsd_handles_fractional_seconds(
-        self, ftp_client: FTPClient, mock_ftp: MagicMock
-    ):
-        """Test MLSD time parsing with fractional seconds."""
-        mock_ftp.mlsd.return_value = [
-            ("file.txt", {"type": "file", "size": "100", "modify": "20240115103000.123"}),
-        ]
-
-        result = ftp_client.list_dir("/test")
-
-        assert result[0].mtime == datetime(2024, 1, 15, 10, 30, 0)
-
 
 class TestFTPClientListDirLIST:
     """Tests for list_dir with LIST format fallback."""
@@ -261,39 +251,6 @@ class TestFTPClientListDirLIST:
         assert dir_entry is not None
         assert dir_entry.is_dir is True
 
-    def test_list_dir_list_parses_windows_format(self, ftp_client: FTPClient, mock_ftp: MagicMock):
-        """Test LIST parsing for Windows format."""
-        ftp_client._supports_mlsd = False
-
-        def capture_list(cmd, callback):
-            for line in [
-                "01-15-24  10:30AM              1024 file.txt",
-                "01-16-24  12:00PM       <DIR>       folder",
-            ]:
-                callback(line)
-
-        mock_ftp.retrlines.side_effect = capture_list
-
-        result = ftp_client.list_dir("/test")
-
-        assert len(result) == 2
-
-    def test_list_dir_list_handles_filenames_with_spaces(
-        self, ftp_client: FTPClient, mock_ftp: MagicMock
-    ):
-        """Test LIST parsing for filenames with spaces."""
-        ftp_client._supports_mlsd = False
-
-        def capture_list(cmd, callback):
-            callback("-rw-r--r--  1 owner group     1024 Jan 15 10:30 file with spaces.txt")
-
-        mock_ftp.retrlines.side_effect = capture_list
-
-        result = ftp_client.list_dir("/test")
-
-        assert len(result) == 1
-        assert result[0].name == "file with spaces.txt"
-
 
 class TestFTPClientReadFile:
     """Tests for read_file method."""
@@ -302,10 +259,7 @@ class TestFTPClientReadFile:
         """Test that read_file returns bytes."""
         test_content = b"Hello, World!"
 
-        def mock_retrbinary(cmd, callback):
-            callback(test_content)
-
-        mock_ftp.retrbinary.side_effect = mock_retrbinary
+        mock_ftp.retrbinary.side_effect = make_retrbinary(test_content)
 
         result = ftp_client.read_file("/test/file.txt")
 
@@ -316,12 +270,9 @@ class TestFTPClientReadFile:
         """Test read_file with offset using REST command."""
         full_content = b"Hello, World!"
 
-        def mock_retrbinary(cmd, callback):
-            # In real REST scenario, server would skip first 7 bytes
-            # Here we simulate full download
-            callback(full_content)
-
-        mock_ftp.retrbinary.side_effect = mock_retrbinary
+        # In real REST scenario, server would skip first 7 bytes
+        # Here we simulate full download
+        mock_ftp.retrbinary.side_effect = make_retrbinary(full_content)
 
         ftp_client.read_file("/test/file.txt", offset=7)
 
@@ -329,22 +280,58 @@ class TestFTPClientReadFile:
         mock_ftp.sendcmd.assert_any_call("REST 7")
 
     def test_read_file_with_length(self, ftp_client: FTPClient, mock_ftp: MagicMock):
-        """Test read_file with length limit."""
-        full_content = b"Hello, World!"
-
-        def mock_retrbinary(cmd, callback):
-            callback(full_content)
-
-        mock_ftp.retrbinary.side_effect = mock_retrbinary
+        """Test that a ranged read stops receiving once length bytes arrived."""
+        conn = make_data_channel(mock_ftp, b"Hello, World!" * 1000)
+        mock_ftp.voidresp.side_effect = ftplib.error_temp("426 Connection closed")
 
         result = ftp_client.read_file("/test/file.txt", offset=0, length=5)
 
         assert result == b"Hello"
+        mock_ftp.transfercmd.assert_called_once_with("RETR /test/file.txt")
+        mock_ftp.retrbinary.assert_not_called()
+        assert sum(c.args[0] for c in conn.recv.call_args_list) == 5
+        conn.__exit__.assert_called_once()
+
+    def test_read_file_with_length_past_eof(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that a ranged read past EOF returns what exists and checks the 226."""
+        make_data_channel(mock_ftp, b"short")
+
+        result = ftp_client.read_file("/test/file.txt", offset=0, length=100)
+
+        assert result == b"short"
+        mock_ftp.voidresp.assert_called_once()
+
+    def test_read_file_transfer_error_at_eof_raises(
+        self, ftp_client: FTPClient, mock_ftp: MagicMock
+    ):
+        """Test that a 4xx after a complete transfer is not mistaken for our early close."""
+        make_data_channel(mock_ftp, b"short")
+        mock_ftp.voidresp.side_effect = ftplib.error_temp("451 Local error")
+
+        with pytest.raises(OSError):
+            ftp_client.read_file("/test/file.txt", offset=0, length=100)
+
+    def test_read_file_zero_length(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that a zero-length read never opens a transfer."""
+        assert ftp_client.read_file("/test/file.txt", offset=10, length=0) == b""
+
+        mock_ftp.sendcmd.assert_not_called()
+        mock_ftp.transfercmd.assert_not_called()
+
+    def test_read_file_slices_chunks_without_rest(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test offset and length are applied to the prefix when REST is unavailable."""
+        ftp_client._supports_rest = False
+        make_data_channel(mock_ftp, b"Hello, World!")
+
+        result = ftp_client.read_file("/test/file.txt", offset=3, length=6)
+
+        assert result == b"lo, Wo"
+        assert type(result) is bytes
 
     def test_read_file_normalizes_path(self, ftp_client: FTPClient, mock_ftp: MagicMock):
         """Test that read_file normalizes the path."""
 
-        def mock_retrbinary(cmd, callback):
+        def mock_retrbinary(cmd, callback, blocksize=8192):
             # Verify command uses normalized path
             assert "RETR /test/file.txt" in cmd
             callback(b"content")
@@ -371,6 +358,23 @@ class TestFTPClientWriteFile:
         call_args = mock_ftp.storbinary.call_args
         assert "STOR /test/file.txt" in call_args[0][0]
 
+    @pytest.mark.parametrize("block_size", [8192, 256 * 1024, 1024 * 1024])
+    @pytest.mark.parametrize("operation", ["read", "write"])
+    def test_transfers_use_configured_block_size(
+        self, ftp_client: FTPClient, mock_ftp: MagicMock, operation: str, block_size: int
+    ):
+        """Test that RETR/STOR forward FTPConfig.transfer_block_size as blocksize."""
+        ftp_client.ftp_config.transfer_block_size = block_size
+
+        if operation == "read":
+            ftp_client.read_file("/test/file.txt")
+            transfer = mock_ftp.retrbinary
+        else:
+            ftp_client.write_file("/test/file.txt", b"x" * 1024)
+            transfer = mock_ftp.storbinary
+
+        assert transfer.call_args.kwargs["blocksize"] == block_size
+
     def test_write_file_returns_bytes_written(self, ftp_client: FTPClient, mock_ftp: MagicMock):
         """Test that write_file returns number of bytes written."""
         test_data = b"test content"
@@ -382,22 +386,60 @@ class TestFTPClientWriteFile:
     def test_write_file_with_offset_does_read_modify_write(
         self, ftp_client: FTPClient, mock_ftp: MagicMock
     ):
-        """Test that write_file with offset reads existing content first."""
+        """Test that a write inside the file reads existing content first."""
         existing_content = b"existing data here"
+        mock_ftp.size.return_value = len(existing_content)
+        mock_ftp.retrbinary.side_effect = make_retrbinary(existing_content)
+        uploaded = []
+        mock_ftp.storbinary.side_effect = lambda cmd, fp, **_: uploaded.append(fp.read())
 
-        def mock_retrbinary(cmd, callback):
-            callback(existing_content)
-
-        mock_ftp.retrbinary.side_effect = mock_retrbinary
-
-        # Write at offset 9 (overwrite "data here" with "new stuff")
-        ftp_client.write_file("/test/file.txt", b"new stuff", offset=9)
+        # Write at offset 9 (overwrite "dat" with "new")
+        ftp_client.write_file("/test/file.txt", b"new", offset=9)
 
         # Should have read existing content
         mock_ftp.retrbinary.assert_called()
 
         # Should have written modified content
-        mock_ftp.storbinary.assert_called()
+        assert uploaded == [b"existing newa here"]
+
+    def test_write_file_at_end_appends(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that a write at the current size uses APPE without downloading."""
+        mock_ftp.size.return_value = 18
+
+        ftp_client.write_file("/test/file.txt", b"more", offset=18)
+
+        mock_ftp.storbinary.assert_called_once()
+        assert mock_ftp.storbinary.call_args.args[0] == "APPE /test/file.txt"
+        assert mock_ftp.storbinary.call_args.args[1].read() == b"more"
+        mock_ftp.retrbinary.assert_not_called()
+
+    def test_write_file_over_tail_uses_rest(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that a write covering the tail restarts STOR at the offset."""
+        mock_ftp.size.return_value = 18
+
+        ftp_client.write_file("/test/file.txt", b"new stuff!", offset=9)
+
+        mock_ftp.storbinary.assert_called_once()
+        assert mock_ftp.storbinary.call_args.args[0] == "STOR /test/file.txt"
+        assert mock_ftp.storbinary.call_args.kwargs["rest"] == 9
+        mock_ftp.retrbinary.assert_not_called()
+
+    def test_write_file_rest_refused_falls_back(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that a server refusing REST+STOR still gets a full rewrite."""
+        mock_ftp.size.return_value = 4
+        mock_ftp.retrbinary.side_effect = make_retrbinary(b"abcd")
+        uploaded = []
+
+        def storbinary(cmd, fp, blocksize=8192, rest=None):
+            if rest is not None:
+                raise ftplib.error_perm("502 REST not allowed with STOR")
+            uploaded.append(fp.read())
+
+        mock_ftp.storbinary.side_effect = storbinary
+
+        ftp_client.write_file("/test/file.txt", b"XYZ", offset=2)
+
+        assert uploaded == [b"abXYZ"]
 
 
 class TestFTPClientCreateFile:
@@ -431,6 +473,64 @@ class TestFTPClientCreateDir:
         # Should not raise
         ftp_client.create_dir("/test/existing")
 
+    def test_create_dir_only_leaf_missing(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that an existing parent costs no extra MKD round-trips."""
+        ftp_client.create_dir("/a/b/c")
+
+        mock_ftp.mkd.assert_called_once_with("/a/b/c")
+
+    def test_create_dir_all_levels_missing(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that missing ancestors are created bottom-up, then each level is retried."""
+        existing = set()
+
+        def mkd(path):
+            if path.rpartition("/")[0] not in existing | {""}:
+                raise ftplib.error_perm("550 No such file or directory")
+            existing.add(path)
+            return path
+
+        mock_ftp.mkd.side_effect = mkd
+
+        ftp_client.create_dir("/a/b/c")
+
+        assert existing == {"/a", "/a/b", "/a/b/c"}
+        assert [c.args[0] for c in mock_ftp.mkd.call_args_list] == [
+            "/a/b/c",
+            "/a/b",
+            "/a",
+            "/a/b",
+            "/a/b/c",
+        ]
+
+    def test_create_dir_permission_error_not_walked(
+        self, ftp_client: FTPClient, mock_ftp: MagicMock
+    ):
+        """Test that non-550 refusals are raised without trying parents."""
+        mock_ftp.mkd.side_effect = ftplib.error_perm("553 Permission denied")
+
+        with pytest.raises(PermissionError):
+            ftp_client.create_dir("/a/b")
+
+        mock_ftp.mkd.assert_called_once_with("/a/b")
+
+    @pytest.mark.parametrize(
+        "reply,exc",
+        [
+            ("550 Permission denied", PermissionError),
+            ("550 Create directory operation failed.", FileNotFoundError),
+        ],
+    )
+    def test_create_dir_550_without_missing_parent_not_walked(
+        self, ftp_client: FTPClient, mock_ftp: MagicMock, reply: str, exc: type
+    ):
+        """Test that a 550 which does not say 'no such file' is raised for the leaf."""
+        mock_ftp.mkd.side_effect = ftplib.error_perm(reply)
+
+        with pytest.raises(exc, match=reply):
+            ftp_client.create_dir("/a/b")
+
+        mock_ftp.mkd.assert_called_once_with("/a/b")
+
 
 class TestFTPClientDeleteFile:
     """Tests for delete_file method."""
@@ -495,106 +595,128 @@ class TestFTPClientErrorTranslation:
 
         assert "Authentication required" in str(exc_info.value)
 
+    @pytest.mark.parametrize(
+        "message,expected",
+        [
+            ("550 Directory not empty", OSError),
+            ("550 Failed", FileNotFoundError),
+            ("502 Command not implemented", OSError),
+            ("garbled reply", OSError),
+        ],
+    )
+    def test_other_replies_translated(self, ftp_client: FTPClient, message, expected):
+        """Test fallbacks for 550 texts, unmapped codes and non-numeric replies."""
+        result = ftp_client._translate_ftp_error(ftplib.error_perm(message))
+
+        assert type(result) is expected
+        assert str(result) == message
+
 
 class TestFTPClientRetryLogic:
     """Tests for retry logic on transient errors."""
 
-    def test_retry_on_connection_error(self):
+    def test_retry_on_connection_error(self, patched_ftp: MagicMock):
         """Test that transient errors trigger retry."""
         ftp_config = FTPConfig(host="test.server.com")
         conn_config = ConnectionConfig(retry_attempts=3, retry_delay_seconds=0)
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.sendcmd.return_value = "211-Features:\r\n MLSD\r\n211 End"
-
-            call_count = [0]
+        call_count = [0]
 
-            def mlsd_side_effect(path):
-                call_count[0] += 1
-                if call_count[0] < 3:
-                    raise OSError("Connection reset")
-                return [("file.txt", {"type": "file", "size": "100"})]
+        def mlsd_side_effect(path):
+            call_count[0] += 1
+            if call_count[0] < 3:
+                raise OSError("Connection reset")
+            return [("file.txt", {"type": "file", "size": "100"})]
 
-            mock_ftp.mlsd.side_effect = mlsd_side_effect
+        patched_ftp.mlsd.side_effect = mlsd_side_effect
 
-            client = FTPClient(ftp_config, conn_config)
-            client.connect()
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            result = client.list_dir("/test")
+        result = client.list_dir("/test")
 
-            assert len(result) == 1
-            assert call_count[0] == 3
+        assert len(result) == 1
+        assert call_count[0] == 3
 
-    def test_retry_on_timeout(self):
+    def test_retry_on_timeout(self, patched_ftp: MagicMock):
         """Test that timeout errors trigger retry."""
         ftp_config = FTPConfig(host="test.server.com")
         conn_config = ConnectionConfig(retry_attempts=2, retry_delay_seconds=0)
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.sendcmd.return_value = "211-Features:\r\n MLSD\r\n211 End"
-
-            call_count = [0]
+        call_count = [0]
 
-            def mlsd_side_effect(path):
-                call_count[0] += 1
-                if call_count[0] < 2:
-                    raise TimeoutError("Read timed out")
-                return [("file.txt", {"type": "file", "size": "100"})]
+        def mlsd_side_effect(path):
+            call_count[0] += 1
+            if call_count[0] < 2:
+                raise TimeoutError("Read timed out")
+            return [("file.txt", {"type": "file", "size": "100"})]
 
-            mock_ftp.mlsd.side_effect = mlsd_side_effect
+        patched_ftp.mlsd.side_effect = mlsd_side_effect
 
-            client = FTPClient(ftp_config, conn_config)
-            client.connect()
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            result = client.list_dir("/test")
+        result = client.list_dir("/test")
 
-            assert len(result) == 1
-            assert call_count[0] == 2
+        assert len(result) == 1
+        assert call_count[0] == 2
 
-    def test_no_retry_on_permanent_error(self):
+    def test_no_retry_on_permanent_error(self, patched_ftp: MagicMock):
         """Test that permanent errors (550) do not trigger retry."""
         ftp_config = FTPConfig(host="test.server.com")
         conn_config = ConnectionConfig(retry_attempts=3, retry_delay_seconds=0)
+        patched_ftp.mlsd.side_effect = ftplib.error_perm("550 File not found")
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.sendcmd.return_value = "211-Features:\r\n MLSD\r\n211 End"
-            mock_ftp.mlsd.side_effect = ftplib.error_perm("550 File not found")
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            client = FTPClient(ftp_config, conn_config)
-            client.connect()
+        with pytest.raises(FileNotFoundError):
+            client.list_dir("/nonexistent")
+
+        # Should only be called once (no retry)
+        assert patched_ftp.mlsd.call_count == 1
+
+    @pytest.mark.parametrize(
+        "error,retried",
+        [
+            (ftplib.error_temp("421 Service not available"), True),
+            (ftplib.error_reply("450 File unavailable"), True),
+            (EOFError(), True),
+            (FileNotFoundError("Could not parse MLST response"), False),
+            (ftplib.error_reply("150 Unexpected preliminary reply"), False),
+        ],
+    )
+    def test_retry_decided_by_error_kind(self, patched_ftp: MagicMock, error, retried):
+        """Test that transient 4xx/dropped-connection errors retry and others do not."""
+        ftp_config = FTPConfig(host="test.server.com")
+        conn_config = ConnectionConfig(retry_attempts=2, retry_delay_seconds=0)
+        patched_ftp.mlsd.side_effect = [error, [("file.txt", {"type": "file"})]]
 
-            with pytest.raises(FileNotFoundError):
-                client.list_dir("/nonexistent")
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            # Should only be called once (no retry)
-            assert mock_ftp.mlsd.call_count == 1
+        if retried:
+            assert len(client.list_dir("/test")) == 1
+        else:
+            with pytest.raises(type(error)):
+                client.list_dir("/test")
+        assert patched_ftp.mlsd.call_count == (2 if retried else 1)
 
-    def test_raises_after_all_retries_exhausted(self):
+    def test_raises_after_all_retries_exhausted(self, patched_ftp: MagicMock):
         """Test that error is raised after all retries are exhausted."""
         ftp_config = FTPConfig(host="test.server.com")
         conn_config = ConnectionConfig(retry_attempts=3, retry_delay_seconds=0)
 
-        with patch("ftp_winmount.ftp_client.ftplib.FTP") as MockFTP:
-            mock_ftp = MagicMock()
-            MockFTP.return_value = mock_ftp
-            mock_ftp.sendcmd.return_value = "211-Features:\r\n MLSD\r\n211 End"
+        # All calls fail
+        patched_ftp.mlsd.side_effect = OSError("Connection reset")
 
-            # All calls fail
-            mock_ftp.mlsd.side_effect = OSError("Connection reset")
+        client = FTPClient(ftp_config, conn_config)
+        client.connect()
 
-            client = FTPClient(ftp_config, conn_config)
-            client.connect()
-
-            with pytest.raises(IOError):
-                client.list_dir("/test")
+        with pytest.raises(IOError):
+            client.list_dir("/test")
 
-            assert mock_ftp.mlsd.call_count == 3
+        assert patched_ftp.mlsd.call_count == 3
 
 
 class TestFTPClientPathNormalization:
@@ -635,6 +757,17 @@ class TestFTPClientGetFileInfo:
         assert result.size == 1024
         assert result.is_dir is False
 
+    def test_get_file_info_mlst_name_with_spaces(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that the MLST pathname is everything after the facts."""
+        mock_ftp.sendcmd.return_value = (
+            "250-Listing\r\n type=dir;modify=20240115103000; my dir;v2\r\n250 End"
+        )
+
+        result = ftp_client.get_file_info("/my dir;v2")
+
+        assert result.name == "my dir;v2"
+        assert result.is_dir is True
+
     def test_get_file_info_root_directory(self, ftp_client: FTPClient, mock_ftp: MagicMock):
         """Test get_file_info for root directory."""
         ftp_client._supports_mlst = False
@@ -646,6 +779,144 @@ class TestFTPClientGetFileInfo:
         assert result.size == 0
 
 
+class TestFTPClientStatCache:
+    """Tests for the short-lived stat/listing cache."""
+
+    MLST_REPLY = "250-Listing /test/file.txt\r\n type=file;size=1024;modify=20240115103000; file.txt\r\n250 End"
+
+    @pytest.fixture
+    def conn_config(self) -> ConnectionConfig:
+        """ConnectionConfig with the opt-in client cache turned on."""
+        return ConnectionConfig(retry_delay_seconds=0, stat_cache_ttl_seconds=30)
+
+    def _mlst_calls(self, mock_ftp: MagicMock) -> int:
+        return sum(1 for c in mock_ftp.sendcmd.call_args_list if c.args[0].startswith("MLST"))
+
+    def test_repeated_get_file_info_issues_one_mlst(
+        self, ftp_client: FTPClient, mock_ftp: MagicMock
+    ):
+        """Test that a second stat within the TTL is served from the cache."""
+        mock_ftp.sendcmd.return_value = self.MLST_REPLY
+
+        first = ftp_client.get_file_info("/test/file.txt")
+        second = ftp_client.get_file_info("/test/file.txt")
+
+        assert first is second
+        assert self._mlst_calls(mock_ftp) == 1
+
+    def test_repeated_list_dir_issues_one_mlsd(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that a second listing within the TTL is served from the cache."""
+        mock_ftp.mlsd.return_value = [("a.txt", {"type": "file", "size": "1"})]
+
+        ftp_client.list_dir("/test").append("caller mutation")
+        result = ftp_client.list_dir("/test")
+
+        assert [s.name for s in result] == ["a.txt"]
+        mock_ftp.mlsd.assert_called_once()
+
+    def test_list_dir_reuses_listing_made_while_waiting(
+        self, ftp_client: FTPClient, mock_ftp: MagicMock
+    ):
+        """Test that a listing cached while waiting for the lock is not re-issued."""
+        cached = [FileStats(name="a.txt", size=1, mtime=datetime.now(), is_dir=False)]
+        # Miss before taking the connection lock, hit once holding it
+        ftp_client._listdir_cache.get = MagicMock(side_effect=[None, cached])
+
+        result = ftp_client.list_dir("/test")
+
+        assert result == cached
+        mock_ftp.mlsd.assert_not_called()
+
+    def test_get_file_info_reuses_stat_made_while_waiting(
+        self, ftp_client: FTPClient, mock_ftp: MagicMock
+    ):
+        """Test that a stat cached while waiting for the lock is not re-issued."""
+        cached = FileStats(name="file.txt", size=3, mtime=datetime.now(), is_dir=False)
+        ftp_client._stat_cache.get = MagicMock(side_effect=[None, cached])
+
+        assert ftp_client.get_file_info("/test/file.txt") is cached
+        assert self._mlst_calls(mock_ftp) == 0
+
+    def test_list_dir_warms_child_stats(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that stat of a listed child is served from the listing."""
+        mock_ftp.mlsd.return_value = [("a.txt", {"type": "file", "size": "7"})]
+
+        ftp_client.list_dir("/test")
+        stats = ftp_client.get_file_info("/test/a.txt")
+
+        assert stats.size == 7
+        assert self._mlst_calls(mock_ftp) == 0
+
+    def test_missing_path_cached(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that a repeated stat of a missing path issues one MLST."""
+        mock_ftp.sendcmd.side_effect = ftplib.error_perm("550 No such file")
+
+        for _ in range(2):
+            with pytest.raises(FileNotFoundError):
+                ftp_client.get_file_info("/desktop.ini")
+
+        assert self._mlst_calls(mock_ftp) == 1
+
+    def test_permission_550_not_cached_as_missing(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that only a 'not found' 550 is remembered as a miss."""
+        mock_ftp.sendcmd.side_effect = ftplib.error_perm("550 Permission denied")
+
+        for _ in range(2):
+            with pytest.raises(PermissionError):
+                ftp_client.get_file_info("/secret.txt")
+
+        assert self._mlst_calls(mock_ftp) == 2
+
+    def test_miss_from_cache_not_stored_again(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that a miss found by the re-check under the lock keeps its expiry."""
+        ftp_client._stat_cache.get = MagicMock(side_effect=[None, _MISSING])
+        ftp_client._stat_cache.put = MagicMock()
+
+        with pytest.raises(FileNotFoundError):
+            ftp_client.get_file_info("/desktop.ini")
+
+        ftp_client._stat_cache.put.assert_not_called()
+        assert self._mlst_calls(mock_ftp) == 0
+
+    def test_create_file_clears_cached_miss(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that creating a file drops its cached 'not found'."""
+        mock_ftp.sendcmd.side_effect = ftplib.error_perm("550 No such file")
+        with pytest.raises(FileNotFoundError):
+            ftp_client.get_file_info("/test/file.txt")
+
+        ftp_client.create_file("/test/file.txt")
+        mock_ftp.sendcmd.side_effect = None
+        mock_ftp.sendcmd.return_value = self.MLST_REPLY
+
+        assert ftp_client.get_file_info("/test/file.txt").size == 1024
+
+    def test_write_file_invalidates(self, ftp_client: FTPClient, mock_ftp: MagicMock):
+        """Test that writing a file drops its stat and its parent's listing."""
+        mock_ftp.sendcmd.return_value = self.MLST_REPLY
+        mock_ftp.mlsd.return_value = []
+        ftp_client.get_file_info("/test/file.txt")
+        ftp_client.list_dir("/test")
+
+        ftp_client.write_file("/test/file.txt", b"new")
+        ftp_client.get_file_info("/test/file.txt")
+        ftp_client.list_dir("/test")
+
+        assert self._mlst_calls(mock_ftp) == 2
+        assert mock_ftp.mlsd.call_count == 2
+
+    def test_zero_ttl_disables_cache(
+        self, ftp_config: FTPConfig, mock_ftp: MagicMock, ftp_client: FTPClient
+    ):
+        """Test that stat_cache_ttl_seconds=0 always asks the server."""
+        ftp_client.conn_config = ConnectionConfig(stat_cache_ttl_seconds=0)
+        mock_ftp.sendcmd.return_value = self.MLST_REPLY
+
+        ftp_client.get_file_info("/test/file.txt")
+        ftp_client.get_file_info("/test/file.txt")
+
+        assert self._mlst_calls(mock_ftp) == 2
+
+
 class TestFileStats:
     """Tests for FileStats dataclass."""
 
@@ -672,3 +943,21 @@ class TestFileStats:
         )
 
         assert stats.attributes == 0
+
+    def test_filestats_filetime(self):
+        """Test FileStats converts mtime to a Windows FILETIME."""
+        stats = FileStats(
+            name="test.txt",
+            size=1024,
+            mtime=datetime(1970, 1, 1, tzinfo=timezone.utc),
+            is_dir=False,
+        )
+
+        assert stats.filetime() == 116444736000000000
+        # Cached value is excluded from equality
+        assert stats == FileStats(
+            name="test.txt",
+            size=1024,
+            mtime=datetime(1970, 1, 1, tzinfo=timezone.utc),
+            is_dir=False,
+        )
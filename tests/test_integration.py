@@ -15,18 +15,20 @@ Note: Tests that require WinFsp mount are skipped as WinFsp cannot be tested
 in CI environments.
 """
 
+import socket
 import threading
 import time
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 # Import pyftpdlib components for mock FTP server
 from pyftpdlib.authorizers import DummyAuthorizer
 from pyftpdlib.handlers import FTPHandler
-from pyftpdlib.servers import FTPServer
+from pyftpdlib.servers import ThreadedFTPServer
 
 # Import our modules under test
 from ftp_winmount.cache import DirectoryCache
@@ -34,6 +36,8 @@ from ftp_winmount.config import CacheConfig, ConnectionConfig, FTPConfig
 from ftp_winmount.filesystem import FTPFileSystem
 from ftp_winmount.ftp_client import FTPClient
 
+pytestmark = pytest.mark.slow
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -57,23 +61,23 @@ def ftp_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
     root_dir = tmp_path_factory.mktemp("ftp_root")
 
     # Create test.txt in root
-    (root_dir / "test.txt").write_text("Hello World", encoding="utf-8")
+    (root_dir / "test.txt").write_bytes(b"Hello World")
 
     # Create folder with spaces and nested file
     folder_spaces = root_dir / "folder with spaces"
     folder_spaces.mkdir()
-    (folder_spaces / "file.txt").write_text("Nested", encoding="utf-8")
+    (folder_spaces / "file.txt").write_bytes(b"Nested")
 
     # Create folder with special characters
     special_folder = root_dir / "special-chars"
     special_folder.mkdir()
-    (special_folder / "file's name.txt").write_text("Special", encoding="utf-8")
+    (special_folder / "file's name.txt").write_bytes(b"Special")
 
     # Create empty folder
     (root_dir / "empty_folder").mkdir()
 
     # Create a file for read testing
-    (root_dir / "readonly_test.txt").write_text("Readonly content", encoding="utf-8")
+    (root_dir / "readonly_test.txt").write_bytes(b"Readonly content")
 
     return root_dir
 
@@ -101,8 +105,9 @@ def ftp_server(ftp_root: Path) -> Generator[dict[str, Any], None, None]:
     handler.authorizer = authorizer
     handler.passive_ports = range(60000, 60100)
 
-    # Create server on random available port
-    server = FTPServer(("127.0.0.1", 0), handler)
+    # Create server on random available port; one thread per session so
+    # concurrent clients in a test do not serialize on the server
+    server = ThreadedFTPServer(("127.0.0.1", 0), handler)
     port = server.socket.getsockname()[1]
 
     # Start server in background thread
@@ -110,8 +115,16 @@ def ftp_server(ftp_root: Path) -> Generator[dict[str, Any], None, None]:
     server_thread.daemon = True
     server_thread.start()
 
-    # Small delay to ensure server is ready
-    time.sleep(0.1)
+    # Wait until the server accepts connections instead of sleeping blindly
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.005)
 
     yield {
         "host": "127.0.0.1",
@@ -123,7 +136,7 @@ def ftp_server(ftp_root: Path) -> Generator[dict[str, Any], None, None]:
     server.close_all()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ftp_config_for_server(ftp_server: dict[str, Any]) -> FTPConfig:
     """Create FTPConfig for connecting to the test FTP server."""
     return FTPConfig(
@@ -136,7 +149,7 @@ def ftp_config_for_server(ftp_server: dict[str, Any]) -> FTPConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def conn_config_fast() -> ConnectionConfig:
     """Create ConnectionConfig with fast timeouts for testing."""
     return ConnectionConfig(
@@ -157,18 +170,26 @@ def cache_config_short_ttl() -> CacheConfig:
     )
 
 
-@pytest.fixture
-def integration_ftp_client(
+@pytest.fixture(scope="module")
+def _shared_ftp_client(
     ftp_config_for_server: FTPConfig,
     conn_config_fast: ConnectionConfig,
 ) -> Generator[FTPClient, None, None]:
-    """Create an FTPClient connected to the test FTP server."""
+    """One logged-in FTPClient for the whole module, to avoid a handshake per test."""
     client = FTPClient(ftp_config_for_server, conn_config_fast)
     client.connect()
     yield client
     client.disconnect()
 
 
+@pytest.fixture
+def integration_ftp_client(_shared_ftp_client: FTPClient) -> FTPClient:
+    """The shared FTPClient, with its stat/listing caches emptied for this test."""
+    _shared_ftp_client._stat_cache.clear()
+    _shared_ftp_client._listdir_cache.clear()
+    return _shared_ftp_client
+
+
 @pytest.fixture
 def integration_filesystem(
     integration_ftp_client: FTPClient,
@@ -622,12 +643,16 @@ class TestCacheBehavior:
         """Test that directory listing is cached."""
         # First call populates cache - use open() which returns a properly constructed context
         ctx = integration_filesystem.open("\\", 0, 0)
-        integration_filesystem.read_directory(ctx, None)
+        list_dir = MagicMock(wraps=integration_filesystem._list_dir)
+        integration_filesystem._list_dir = list_dir
+
+        first = integration_filesystem.read_directory(ctx, None)
+        second = integration_filesystem.read_directory(ctx, None)
 
-        # Second call should use cache (verify by checking cache)
-        cached = integration_filesystem.dir_cache.get("/")
-        assert cached is not None
-        assert len(cached) > 0
+        # Second call is served from the cache without listing again
+        assert len(first) > 0
+        assert second == first
+        list_dir.assert_called_once_with("/")
 
     def test_cache_invalidated_after_write(
         self,
@@ -667,17 +692,20 @@ class TestCacheBehavior:
         # Create cache with short TTL
         dir_cache = DirectoryCache(cache_config_short_ttl.directory_ttl_seconds)
 
-        # Put something in cache
-        dir_cache.put("/", [{"name": "test"}])
+        with patch("ftp_winmount.cache.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+
+            # Put something in cache
+            dir_cache.put("/", [{"file_name": "test"}])
 
-        # Verify it's there
-        assert dir_cache.get("/") is not None
+            # Verify it's there
+            assert dir_cache.get("/") is not None
 
-        # Wait for TTL to expire
-        time.sleep(cache_config_short_ttl.directory_ttl_seconds + 0.5)
+            # Step the clock past the TTL instead of waiting it out
+            mock_time.return_value = 1000.0 + cache_config_short_ttl.directory_ttl_seconds + 0.5
 
-        # Cache should be expired
-        assert dir_cache.get("/") is None
+            # Cache should be expired
+            assert dir_cache.get("/") is None
 
     def test_metadata_cache_is_populated(self, integration_filesystem: FTPFileSystem) -> None:
         """Test that metadata cache is populated on file access."""
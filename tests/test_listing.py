@@ -0,0 +1,163 @@
+"""
+Unit tests for ftp_winmount.listing module.
+
+Tests cover:
+- parse_facts for MLSx fact strings
+- parse_mlsd_entry for files, directories and fractional timestamps
+- parse_mlsd_time fallbacks
+- parse_list_line for Unix and Windows formats, including localized months
+  and 24-hour DOS times
+- parse_list_line rejects blank and unknown lines
+"""
+
+from datetime import datetime
+
+import pytest
+
+from ftp_winmount.listing import parse_facts, parse_list_line, parse_mlsd_entry, parse_mlsd_time
+
+
+class TestParseFacts:
+    """Tests for parse_facts."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            (
+                "type=file;size=1024;modify=20240115103000;",
+                {"type": "file", "size": "1024", "modify": "20240115103000"},
+            ),
+            ("Type=dir;Modify=20240115103000", {"type": "dir", "modify": "20240115103000"}),
+            ("unix.mode=0644;perm=adfrw;", {"unix.mode": "0644", "perm": "adfrw"}),
+            ("x=a=b;;novalue;", {"x": "a=b"}),
+            ("", {}),
+        ],
+    )
+    def test_parses_facts(self, raw, expected):
+        """Test that facts are split on ';' and '=' with lower-cased names."""
+        assert parse_facts(raw) == expected
+
+
+class TestParseMlsdEntry:
+    """Tests for parse_mlsd_entry."""
+
+    @pytest.mark.parametrize(
+        "name,facts,expected",
+        [
+            (
+                "file1.txt",
+                {"type": "file", "size": "1024", "modify": "20240115103000"},
+                ("file1.txt", 1024, False, datetime(2024, 1, 15, 10, 30, 0)),
+            ),
+            (
+                "folder",
+                {"type": "dir", "size": "4096", "modify": "20240115103000"},
+                ("folder", 0, True, datetime(2024, 1, 15, 10, 30, 0)),
+            ),
+            (
+                "file.txt",
+                {"type": "file", "size": "100", "modify": "20240115103000.123"},
+                ("file.txt", 100, False, datetime(2024, 1, 15, 10, 30, 0)),
+            ),
+            (
+                "Upper",
+                {"type": "DIR", "modify": "20231231235959"},
+                ("Upper", 0, True, datetime(2023, 12, 31, 23, 59, 59)),
+            ),
+        ],
+    )
+    def test_parses_entry(self, name, facts, expected):
+        """Test that MLSD facts map onto FileStats fields."""
+        stats = parse_mlsd_entry(name, facts)
+
+        assert (stats.name, stats.size, stats.is_dir, stats.mtime) == expected
+
+    @pytest.mark.parametrize(
+        "time_str", ["", "not-a-time", "2024011510", "20241315103000", "2024011510300012"]
+    )
+    def test_unparseable_time_falls_back_to_now(self, time_str):
+        """Test that missing or malformed modify facts use the current time."""
+        before = datetime.now()
+
+        result = parse_mlsd_time(time_str)
+
+        assert before <= result <= datetime.now()
+
+
+class TestParseListLine:
+    """Tests for parse_list_line."""
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            (
+                "-rw-r--r--  1 owner group     1024 Jan 15 10:30 file.txt",
+                ("file.txt", 1024, False),
+            ),
+            (
+                "drwxr-xr-x  2 owner group     4096 Jan 16 12:00 folder",
+                ("folder", 0, True),
+            ),
+            (
+                "-rw-r--r--  1 owner group     1024 Jan 15 10:30 file with spaces.txt",
+                ("file with spaces.txt", 1024, False),
+            ),
+            (
+                "-rw-r--r--  1 owner group        1 Jan 15 10:30 tiny.txt",
+                ("tiny.txt", 1, False),
+            ),
+            (
+                "-rw-r--r--+ 1 owner group       12 Jan 15 10:30 acl.txt",
+                ("acl.txt", 12, False),
+            ),
+            (
+                "-rw-r--r--  1 owner group     1024 janv. 15 10:30 localized.txt",
+                ("localized.txt", 1024, False),
+            ),
+            (
+                "-rw-r--r--  1 owner group     2048 Mär 15  2023 umlaut.txt",
+                ("umlaut.txt", 2048, False),
+            ),
+            (
+                "01-15-24  10:30AM              1024 file.txt",
+                ("file.txt", 1024, False),
+            ),
+            (
+                "01-15-24  14:30              1024 file.txt",
+                ("file.txt", 1024, False),
+            ),
+            (
+                "01-16-24  09:05       <DIR>       folder",
+                ("folder", 0, True),
+            ),
+            (
+                "01-16-24  12:00PM       <DIR>       folder",
+                ("folder", 0, True),
+            ),
+        ],
+    )
+    def test_parses_line(self, line, expected):
+        """Test Unix and Windows LIST lines map onto FileStats fields."""
+        stats = parse_list_line(line)
+
+        assert stats is not None
+        assert (stats.name, stats.size, stats.is_dir) == expected
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            ("-rw-r--r--  1 owner group  1 Mar  3  2020 old.txt", datetime(2020, 3, 3, 0, 0)),
+            ("01-15-24  12:05AM         1 midnight.txt", datetime(2024, 1, 15, 0, 5)),
+            ("01-15-24  01:05PM         1 afternoon.txt", datetime(2024, 1, 15, 13, 5)),
+            ("01-15-24  14:30           1 24h.txt", datetime(2024, 1, 15, 14, 30)),
+            ("01-15-24  12:10           1 noon.txt", datetime(2024, 1, 15, 12, 10)),
+        ],
+    )
+    def test_parses_mtime(self, line, expected):
+        """Test LIST date/time parsing, including year-only and AM/PM forms."""
+        assert parse_list_line(line).mtime == expected
+
+    @pytest.mark.parametrize("line", ["", "   ", "total 12", "garbage line with words"])
+    def test_rejects_blank_and_unknown_lines(self, line):
+        """Test that lines which are not directory entries return None."""
+        assert parse_list_line(line) is None
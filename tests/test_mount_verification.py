@@ -117,6 +117,7 @@ def test_get_file_info_return_format():
     mock_config = MagicMock()
     mock_config.directory_ttl_seconds = 30
     mock_config.metadata_ttl_seconds = 60
+    mock_config.max_entries = 10000
 
     fs = FTPFileSystem(mock_ftp, mock_config)
 
@@ -166,6 +167,7 @@ def test_read_directory_return_format():
     mock_config = MagicMock()
     mock_config.directory_ttl_seconds = 30
     mock_config.metadata_ttl_seconds = 60
+    mock_config.max_entries = 10000
 
     fs = FTPFileSystem(mock_ftp, mock_config)
 
@@ -197,6 +199,7 @@ def test_close_does_nothing():
     mock_config = MagicMock()
     mock_config.directory_ttl_seconds = 30
     mock_config.metadata_ttl_seconds = 60
+    mock_config.max_entries = 10000
 
     fs = FTPFileSystem(mock_ftp, mock_config)
 
@@ -232,6 +235,7 @@ def test_full_open_get_file_info_close_cycle():
     mock_config = MagicMock()
     mock_config.directory_ttl_seconds = 30
     mock_config.metadata_ttl_seconds = 60
+    mock_config.max_entries = 10000
 
     fs = FTPFileSystem(mock_ftp, mock_config)
 
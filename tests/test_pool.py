@@ -0,0 +1,140 @@
+"""
+Unit tests for ftp_winmount.pool module.
+
+Tests cover:
+- Released connections are reused by the next acquire
+- Dead and idle-expired connections are closed instead of reused
+- Pool size limit per key
+- FTPClient reuses a pooled session without logging in again
+- Sessions are not shared across password, passive mode or encoding
+"""
+
+import ftplib
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ftp_winmount.config import ConnectionConfig, FTPConfig
+from ftp_winmount.ftp_client import FTPClient
+from ftp_winmount.pool import FTPPool
+
+KEY = ("test.ftp.local", 21, "user", "secret", False, True, "utf-8")
+
+
+class TestFTPPool:
+    """Tests for FTPPool acquire/release."""
+
+    def test_acquire_empty_returns_none(self):
+        """Test that acquiring from an empty pool returns None."""
+        assert FTPPool().acquire(KEY) is None
+
+    def test_release_then_acquire_reuses_connection(self):
+        """Test that a released connection is handed back after a NOOP check."""
+        pool = FTPPool()
+        ftp = MagicMock(spec=ftplib.FTP)
+
+        pool.release(KEY, ftp, max_idle=1)
+
+        assert pool.acquire(KEY) is ftp
+        ftp.voidcmd.assert_called_once_with("NOOP")
+        assert pool.acquire(KEY) is None
+
+    def test_acquire_is_keyed_by_server_and_user(self):
+        """Test that connections are not shared across different keys."""
+        pool = FTPPool()
+        pool.release(KEY, MagicMock(spec=ftplib.FTP), max_idle=1)
+
+        assert pool.acquire(("test.ftp.local", 21, "other", "secret", False, True, "utf-8")) is None
+
+    def test_dead_connection_is_discarded(self):
+        """Test that a connection failing NOOP is closed and skipped."""
+        pool = FTPPool()
+        dead = MagicMock(spec=ftplib.FTP)
+        dead.voidcmd.side_effect = ftplib.error_temp("421 Timeout")
+        pool.release(KEY, dead, max_idle=1)
+
+        assert pool.acquire(KEY) is None
+        dead.quit.assert_called_once()
+
+    def test_idle_timeout_closes_connection(self):
+        """Test that connections idle past the timeout are not reused."""
+        pool = FTPPool(idle_timeout_seconds=-1)
+        ftp = MagicMock(spec=ftplib.FTP)
+        pool.release(KEY, ftp, max_idle=1)
+
+        assert pool.acquire(KEY) is None
+        ftp.voidcmd.assert_not_called()
+        ftp.quit.assert_called_once()
+
+    def test_release_beyond_max_idle_closes(self):
+        """Test that releases past max_idle close the extra connection."""
+        pool = FTPPool()
+        kept, extra = MagicMock(spec=ftplib.FTP), MagicMock(spec=ftplib.FTP)
+
+        pool.release(KEY, kept, max_idle=1)
+        pool.release(KEY, extra, max_idle=1)
+
+        extra.quit.assert_called_once()
+        kept.quit.assert_not_called()
+
+    def test_clear_closes_idle_connections(self):
+        """Test that clear closes everything held by the pool."""
+        pool = FTPPool()
+        ftp = MagicMock(spec=ftplib.FTP)
+        pool.release(KEY, ftp, max_idle=1)
+
+        pool.clear()
+
+        ftp.quit.assert_called_once()
+        assert pool.acquire(KEY) is None
+
+
+class TestFTPClientPooling:
+    """Tests for FTPClient integration with FTPPool."""
+
+    def test_second_client_reuses_session(self, patched_ftp: MagicMock, ftp_config: FTPConfig):
+        """Test that a client connecting after another disconnects skips login."""
+        pool = FTPPool()
+        conn_config = ConnectionConfig(pool_size=1)
+
+        first = FTPClient(ftp_config, conn_config, pool=pool)
+        first.connect()
+        first.disconnect()
+        second = FTPClient(ftp_config, conn_config, pool=pool)
+        second.connect()
+
+        patched_ftp.login.assert_called_once()
+        patched_ftp.quit.assert_not_called()
+        assert second._ftp is patched_ftp
+
+    def test_pooling_disabled_by_default(self, patched_ftp: MagicMock, ftp_config: FTPConfig):
+        """Test that pool_size=0 keeps the plain connect/QUIT behavior."""
+        pool = FTPPool()
+
+        client = FTPClient(ftp_config, ConnectionConfig(), pool=pool)
+        client.connect()
+        client.disconnect()
+
+        patched_ftp.quit.assert_called_once()
+        assert pool.acquire(client._pool_key) is None
+
+    @pytest.mark.parametrize(
+        "change",
+        [{"passive_mode": False}, {"encoding": "latin-1"}, {"password": "other"}],
+    )
+    def test_session_not_shared_across_settings(
+        self, patched_ftp: MagicMock, ftp_config: FTPConfig, change: dict
+    ):
+        """Test that configs differing only in session settings log in separately."""
+        pool = FTPPool()
+        conn_config = ConnectionConfig(pool_size=1)
+
+        first = FTPClient(ftp_config, conn_config, pool=pool)
+        first.connect()
+        first.disconnect()
+        second = FTPClient(replace(ftp_config, **change), conn_config, pool=pool)
+        second.connect()
+
+        assert patched_ftp.login.call_count == 2
+        assert pool.acquire(first._pool_key) is not None